@@ -26,7 +26,7 @@ from src.utils.weather_fetcher import WeatherAPIFetcher
 from src.utils.crop_database import get_crop_info
 
 # New imports
-from database.db_utils import DatabaseManager
+from database.db_utils import get_shared_manager
 from src.auth.auth import FarmerAuthService, require_auth
 from src.services.rindm_cycle_manager import RINDMCycleManager
 from src.services.weather_monitor import get_monitor_instance, start_monitor
@@ -35,7 +35,7 @@ app = Flask(__name__)
 CORS(app, resources={r"/api/*": {"origins": "*", "methods": ["GET", "POST", "PUT", "DELETE", "OPTIONS"], "allow_headers": ["Content-Type", "Authorization"]}})
 
 # Initialize services
-db = DatabaseManager()
+db = get_shared_manager()
 auth_service = FarmerAuthService(db)
 recommender = FarmerCropRecommender()
 weather_fetcher = WeatherAPIFetcher()
@@ -46,8 +46,11 @@ MONITOR_ENABLED = os.getenv('ENABLE_WEATHER_MONITOR', 'true').lower() == 'true'
 MONITOR_INTERVAL = int(os.getenv('WEATHER_CHECK_INTERVAL_MINUTES', '60'))
 
 if MONITOR_ENABLED:
-    weather_monitor = start_monitor(check_interval_minutes=MONITOR_INTERVAL)
-    print(f"✓ Weather monitor started (checking every {MONITOR_INTERVAL} minutes)")
+    weather_monitor = start_monitor(check_interval_minutes=MONITOR_INTERVAL, db_manager=db)
+    # start() declines to run without a weather API key
+    MONITOR_ENABLED = weather_monitor.is_active()
+    if MONITOR_ENABLED:
+        print(f"✓ Weather monitor started (checking every {MONITOR_INTERVAL} minutes)")
 else:
     print(f"⚠ Weather monitor disabled (set ENABLE_WEATHER_MONITOR=true to enable)")
 
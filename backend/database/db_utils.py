@@ -16,11 +16,15 @@ Usage:
     status = db.check_nutrient_status(...)
 """
 
+import atexit
 import psycopg2
 from psycopg2.extras import RealDictCursor
+from psycopg2.pool import ThreadedConnectionPool
 from contextlib import contextmanager
 from typing import Dict, List, Optional, Tuple
 import os
+import threading
+import weakref
 from dotenv import load_dotenv
 from datetime import date, datetime
 
@@ -39,7 +43,9 @@ class DatabaseManager:
         port: str = None,
         database: str = None,
         user: str = None,
-        password: str = None
+        password: str = None,
+        pool_min: int = None,
+        pool_max: int = None
     ):
         """
         Initialize database connection parameters.
@@ -47,45 +53,131 @@ class DatabaseManager:
         Args:
             host, port, database, user, password: Connection parameters
             If not provided, reads from environment variables
+            pool_min: Connections kept open between uses (default DB_POOL_MIN)
+            pool_max: Maximum concurrent connections (default DB_POOL_MAX)
         """
         self.host = host or os.getenv('DB_HOST', 'localhost')
         self.port = port or os.getenv('DB_PORT', '5432')
         self.database = database or os.getenv('DB_NAME', 'cropsense_db')
         self.user = user or os.getenv('DB_USER', 'postgres')
         self.password = password or os.getenv('DB_PASSWORD', '')
+        
+        # Connection pool, created on first use so importing modules that
+        # build a DatabaseManager does not require a reachable server
+        if pool_min is None:
+            pool_min = int(os.getenv('DB_POOL_MIN', '1'))
+        if pool_max is None:
+            pool_max = int(os.getenv('DB_POOL_MAX', '10'))
+        self.pool_min = pool_min
+        self.pool_max = max(pool_max, pool_min)
+        self._pool = None
+        self._pool_lock = threading.Lock()
+        # ThreadedConnectionPool raises when exhausted; make callers wait instead
+        self._pool_slots = threading.BoundedSemaphore(self.pool_max)
+        
+        # Names of statements already PREPAREd, tracked per live connection
+        self._prepared = weakref.WeakKeyDictionary()
+    
+    def _get_pool(self) -> ThreadedConnectionPool:
+        """Create the shared connection pool on first use."""
+        if self._pool is None:
+            with self._pool_lock:
+                if self._pool is None:
+                    self._pool = ThreadedConnectionPool(
+                        self.pool_min,
+                        self.pool_max,
+                        host=self.host,
+                        port=self.port,
+                        database=self.database,
+                        user=self.user,
+                        password=self.password,
+                        # Keep idle pooled connections alive between check loops
+                        keepalives=1,
+                        keepalives_idle=30,
+                        keepalives_interval=10,
+                        keepalives_count=3
+                    )
+        return self._pool
+    
+    def close_pool(self):
+        """Close every pooled connection (e.g. on shutdown)."""
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.closeall()
+                self._pool = None
     
     @contextmanager
-    def get_connection(self):
+    def get_connection(self, cursor_factory=RealDictCursor):
         """
         Context manager for database connections.
-        Automatically handles connection and cursor cleanup.
+        Checks a connection out of the pool and returns it afterwards;
+        commits on success and rolls back on error.
+        
+        Args:
+            cursor_factory: Cursor class (default RealDictCursor; NamedTupleCursor
+                builds cheaper rows for hot paths)
         
         Usage:
             with db.get_connection() as (conn, cursor):
                 cursor.execute("SELECT ...")
         """
+        pool = self._get_pool()
         conn = None
         cursor = None
+        broken = False
+        self._pool_slots.acquire()
         try:
-            conn = psycopg2.connect(
-                host=self.host,
-                port=self.port,
-                database=self.database,
-                user=self.user,
-                password=self.password
-            )
-            cursor = conn.cursor(cursor_factory=RealDictCursor)
+            conn = pool.getconn()
+            cursor = conn.cursor(cursor_factory=cursor_factory)
             yield conn, cursor
             conn.commit()
         except Exception as e:
             if conn:
-                conn.rollback()
+                try:
+                    conn.rollback()
+                except psycopg2.Error:
+                    broken = True
+            if isinstance(e, (psycopg2.OperationalError, psycopg2.InterfaceError)):
+                broken = True
             raise e
         finally:
             if cursor:
                 cursor.close()
             if conn:
-                conn.close()
+                # Drop dead connections instead of handing them out again
+                pool.putconn(conn, close=broken or bool(conn.closed))
+            self._pool_slots.release()
+    
+    def execute_prepared(self, cursor, name: str, sql: str, params: Tuple = ()):
+        """
+        Execute a server-side prepared statement, preparing it on first use.
+        
+        PostgreSQL keeps prepared statements per session, so PREPARE is sent
+        once per connection and later calls only send EXECUTE, skipping the
+        parse/plan step.
+        
+        Args:
+            cursor: Cursor from get_connection()
+            name: Statement name (plain SQL identifier)
+            sql: Statement body using $1, $2, ... placeholders
+            params: Values bound to the placeholders
+        
+        Usage:
+            with db.get_connection() as (conn, cursor):
+                db.execute_prepared(
+                    cursor, 'get_field', 'SELECT * FROM fields WHERE field_id = $1', (3,)
+                )
+        """
+        prepared = self._prepared.setdefault(cursor.connection, set())
+        if name not in prepared:
+            cursor.execute(f"PREPARE {name} AS {sql}")
+            prepared.add(name)
+        
+        if params:
+            placeholders = ', '.join(['%s'] * len(params))
+            cursor.execute(f"EXECUTE {name} ({placeholders})", params)
+        else:
+            cursor.execute(f"EXECUTE {name}")
     
     # =========================================================================
     # FARMER OPERATIONS
@@ -462,12 +554,21 @@ class DatabaseManager:
                 'K': row['initial_k_kg_ha'] + row['fertilizer_k'] - row['rainfall_loss_k']
             }
     
+    def ping(self):
+        """
+        Cheap round trip (SELECT 1) to confirm the database is reachable.
+        
+        Raises:
+            psycopg2.OperationalError: If the server cannot be reached
+        """
+        with self.get_connection() as (conn, cursor):
+            cursor.execute("SELECT 1")
+    
     def test_connection(self) -> bool:
         """Test database connection."""
         try:
-            with self.get_connection() as (conn, cursor):
-                cursor.execute("SELECT 1")
-                return True
+            self.ping()
+            return True
         except Exception as e:
             print(f"Connection failed: {e}")
             return False
@@ -479,6 +580,30 @@ def quick_connect() -> DatabaseManager:
     return DatabaseManager()
 
 
+_shared_manager = None
+_shared_manager_lock = threading.Lock()
+
+
+def get_shared_manager() -> DatabaseManager:
+    """
+    Get the process-wide DatabaseManager, creating it on first use.
+    
+    Services built without an explicit db_manager fall back to this one,
+    so the API, cycle manager, advisor and weather monitor share a single
+    connection pool instead of each opening their own. Its pool is closed
+    when the interpreter exits.
+    """
+    global _shared_manager
+    
+    if _shared_manager is None:
+        with _shared_manager_lock:
+            if _shared_manager is None:
+                _shared_manager = DatabaseManager()
+                atexit.register(_shared_manager.close_pool)
+    
+    return _shared_manager
+
+
 if __name__ == "__main__":
     """Test database operations."""
     print("=" * 80)
@@ -0,0 +1,23 @@
+-- ============================================================================
+-- Migration 001: Cycle history indexes
+-- ============================================================================
+-- Adds the newest-first (cycle_id, timestamp DESC) indexes that schema_v2.sql
+-- now creates, for databases set up before they existed.
+--
+-- get_cycle_status reads the last 10 nutrient_measurements and all
+-- rainfall_events of one cycle ordered by time; these indexes serve both
+-- without a sort. notes is left out of INCLUDE because free text can exceed
+-- the btree tuple size limit.
+--
+-- CONCURRENTLY cannot run inside a transaction block, so run this file with
+-- plain psql (no --single-transaction):
+--   psql -U postgres -d cropsense_db -f migrations/001_cycle_history_indexes.sql
+-- ============================================================================
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_measurements_cycle_date
+    ON nutrient_measurements(cycle_id, measurement_date DESC)
+    INCLUDE (measurement_type, n_kg_ha, p_kg_ha, k_kg_ha, below_threshold);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_rainfall_cycle_start
+    ON rainfall_events(cycle_id, event_start DESC)
+    INCLUDE (rainfall_mm, nutrient_loss_n, nutrient_loss_p, nutrient_loss_k);
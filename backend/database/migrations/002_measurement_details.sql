@@ -0,0 +1,12 @@
+-- ============================================================================
+-- Migration 002: Structured measurement details
+-- ============================================================================
+-- Rainfall and cycle-end measurements now record their numbers in a JSONB
+-- details column instead of a formatted notes string, so they can be
+-- queried directly, e.g.:
+--   SELECT * FROM nutrient_measurements WHERE (details->>'rainfall_mm')::numeric > 50;
+--
+--   psql -U postgres -d cropsense_db -f migrations/002_measurement_details.sql
+-- ============================================================================
+
+ALTER TABLE nutrient_measurements ADD COLUMN IF NOT EXISTS details JSONB;
@@ -0,0 +1,13 @@
+-- ============================================================================
+-- Migration 003: Stored cycle length on crop_cycles
+-- ============================================================================
+-- cycle_days is derived from the cycle's own dates, so the cycle status
+-- query no longer joins crop_nutrient_requirements to get the crop length.
+-- Adding a stored generated column rewrites crop_cycles once.
+--
+--   psql -U postgres -d cropsense_db -f migrations/003_cycle_days_column.sql
+-- ============================================================================
+
+ALTER TABLE crop_cycles
+    ADD COLUMN IF NOT EXISTS cycle_days INTEGER
+    GENERATED ALWAYS AS (expected_end_date - start_date) STORED;
@@ -0,0 +1,20 @@
+-- ============================================================================
+-- Migration 004: Partial indexes over active crop cycles
+-- ============================================================================
+-- The weather monitor lists active cycles ordered by last_weather_check and
+-- looks for active cycles past their expected_end_date on every run. Both
+-- indexes only cover status = 'active' rows, so they stay small as completed
+-- cycles accumulate and the ORDER BY is read straight from the index.
+--
+-- CONCURRENTLY cannot run inside a transaction block, so run this file with
+-- plain psql (no --single-transaction):
+--   psql -U postgres -d cropsense_db -f migrations/004_active_cycle_indexes.sql
+-- ============================================================================
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_cc_active_lwc
+    ON crop_cycles(last_weather_check ASC)
+    WHERE status = 'active';
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_cc_active_end_date
+    ON crop_cycles(expected_end_date)
+    WHERE status = 'active';
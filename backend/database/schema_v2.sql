@@ -81,6 +81,7 @@ CREATE TABLE crop_cycles (
     crop_name VARCHAR(50) NOT NULL REFERENCES crop_nutrient_requirements(crop_name),
     start_date DATE NOT NULL,
     expected_end_date DATE,
+    cycle_days INTEGER GENERATED ALWAYS AS (expected_end_date - start_date) STORED,
     actual_end_date DATE,
     status VARCHAR(20) DEFAULT 'active' CHECK (
         status IN ('planning', 'active', 'completed', 'abandoned')
@@ -113,6 +114,8 @@ CREATE TABLE crop_cycles (
 
 CREATE INDEX idx_cycles_farmer ON crop_cycles(farmer_id);
 CREATE INDEX idx_cycles_status ON crop_cycles(status);
+CREATE INDEX idx_cc_active_lwc ON crop_cycles(last_weather_check ASC) WHERE status = 'active';
+CREATE INDEX idx_cc_active_end_date ON crop_cycles(expected_end_date) WHERE status = 'active';
 
 -- ============================================================================
 -- TABLE: rainfall_events
@@ -141,6 +144,10 @@ CREATE TABLE rainfall_events (
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
+-- Newest-first event history per cycle (cycle status page)
+CREATE INDEX idx_rainfall_cycle_start ON rainfall_events(cycle_id, event_start DESC)
+    INCLUDE (rainfall_mm, nutrient_loss_n, nutrient_loss_p, nutrient_loss_k);
+
 -- ============================================================================
 -- TABLE: cycle_recommendations
 -- ============================================================================
@@ -181,9 +188,14 @@ CREATE TABLE nutrient_measurements (
     p_kg_ha DECIMAL(8, 2) NOT NULL,
     k_kg_ha DECIMAL(8, 2) NOT NULL,
     below_threshold BOOLEAN DEFAULT FALSE,
-    notes TEXT
+    notes TEXT,
+    details JSONB  -- structured event data, e.g. {"rainfall_mm": 42.0, "losses": {"N": 3.1, ...}}
 );
 
+-- Latest measurements per cycle (cycle status page)
+CREATE INDEX idx_measurements_cycle_date ON nutrient_measurements(cycle_id, measurement_date DESC)
+    INCLUDE (measurement_type, n_kg_ha, p_kg_ha, k_kg_ha, below_threshold);
+
 -- ============================================================================
 -- TABLE: soil_test_recommendations
 -- ============================================================================
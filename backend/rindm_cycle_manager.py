@@ -90,7 +90,7 @@ class RINDMCycleManager:
         
         # Calculate expected end date
         start_date = date.today()
-        expected_end_date = start_date + timedelta(days=crop_data['cycle_days'])
+        expected_end_date = start_date + timedelta(days=crop_data.cycle_days)
         
         # Create crop cycle
         with self.db.get_connection() as (conn, cursor):
@@ -120,7 +120,7 @@ class RINDMCycleManager:
                 initial_n, initial_p, initial_k, initial_ph,
                 initial_n, initial_p, initial_k,  # current = initial at start
                 soil_type, initial_ph,
-                crop_data['N_uptake_kg_ha'], crop_data['P_uptake_kg_ha'], crop_data['K_uptake_kg_ha']
+                crop_data.N_uptake_kg_ha, crop_data.P_uptake_kg_ha, crop_data.K_uptake_kg_ha
             ))
             
             cycle_id = cursor.fetchone()['cycle_id']
@@ -149,16 +149,16 @@ class RINDMCycleManager:
             'crop': selected_crop,
             'start_date': str(start_date),
             'expected_end_date': str(expected_end_date),
-            'duration_days': crop_data['cycle_days'],
+            'duration_days': crop_data.cycle_days,
             'current_nutrients': {
                 'N': initial_n,
                 'P': initial_p,
                 'K': initial_k
             },
             'crop_requirements': {
-                'N': crop_data['N_uptake_kg_ha'],
-                'P': crop_data['P_uptake_kg_ha'],
-                'K': crop_data['K_uptake_kg_ha']
+                'N': crop_data.N_uptake_kg_ha,
+                'P': crop_data.P_uptake_kg_ha,
+                'K': crop_data.K_uptake_kg_ha
             }
         }
     
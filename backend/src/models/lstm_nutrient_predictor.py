@@ -53,6 +53,10 @@ class LSTMNutrientPredictor:
     - Output: [forecast_days * 3]  (N, P, K predictions)
     """
     
+    # Input feature order expected by the network
+    FEATURES = ['rainfall_mm', 'temperature_avg', 'humidity_avg',
+                'n_kg_ha', 'p_kg_ha', 'k_kg_ha']
+    
     def __init__(
         self,
         lookback_days: int = 30,
@@ -106,8 +110,7 @@ class LSTMNutrientPredictor:
             print(y.shape)  # (150, 21) - forecast 7 days * 3 nutrients
         """
         if features is None:
-            features = ['rainfall_mm', 'temperature_avg', 'humidity_avg', 
-                       'n_kg_ha', 'p_kg_ha', 'k_kg_ha']
+            features = self.FEATURES
         
         # Check for missing columns
         missing = set(features) - set(df.columns)
@@ -319,21 +322,39 @@ class LSTMNutrientPredictor:
                       f"P={pred['predicted_p']:.1f}, "
                       f"K={pred['predicted_k']:.1f}")
         """
+        return self.predict_next_days_from_array(
+            recent_data[self.FEATURES].to_numpy(dtype=np.float32),
+            return_intervals=return_intervals
+        )
+    
+    def predict_next_days_from_array(
+        self,
+        recent_values: np.ndarray,
+        return_intervals: bool = True
+    ) -> Dict:
+        """
+        Same as predict_next_days(), but takes the raw feature matrix.
+        
+        Lets callers that already hold NumPy data skip the DataFrame round
+        trip. Missing values (NaN) are forward- then back-filled.
+        
+        Args:
+            recent_values: Array of shape (days, 6) with columns in FEATURES order
+            return_intervals: Include confidence intervals in output
+        
+        Returns:
+            Same structure as predict_next_days()
+        """
         if self.model is None:
             return {'success': False, 'error': 'Model not trained. Call train() first.'}
         
-        if len(recent_data) < self.lookback_days:
+        if len(recent_values) < self.lookback_days:
             return {
                 'success': False,
-                'error': f'Need {self.lookback_days} days of data, got {len(recent_data)}'
+                'error': f'Need {self.lookback_days} days of data, got {len(recent_values)}'
             }
         
-        # Prepare input
-        features = ['rainfall_mm', 'temperature_avg', 'humidity_avg', 
-                   'n_kg_ha', 'p_kg_ha', 'k_kg_ha']
-        
-        recent_clean = recent_data[features].copy()
-        recent_clean = recent_clean.fillna(method='ffill').fillna(method='bfill')
+        recent_clean = self._fill_gaps(np.asarray(recent_values, dtype=np.float32))
         
         # Normalize using trained scaler
         recent_scaled = self.scaler.transform(recent_clean)
@@ -397,6 +418,19 @@ class LSTMNutrientPredictor:
             'predictions': predictions_list
         }
     
+    @staticmethod
+    def _fill_gaps(values: np.ndarray) -> np.ndarray:
+        """Column-wise forward fill then back fill of NaNs (like ffill().bfill())."""
+        if not np.isnan(values).any():
+            return values
+        
+        def ffill(a):
+            idx = np.where(np.isnan(a), 0, np.arange(a.shape[0])[:, None])
+            np.maximum.accumulate(idx, axis=0, out=idx)
+            return a[idx, np.arange(a.shape[1])]
+        
+        return ffill(ffill(values)[::-1])[::-1]
+    
     # ============================================================================
     # MODEL PERSISTENCE
     # ============================================================================
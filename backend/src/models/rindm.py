@@ -11,7 +11,19 @@ Scientific basis:
 """
 
 import math
-from typing import Dict, Optional, Union, Tuple
+import numpy as np
+from typing import Dict, Optional, Union, Tuple, Sequence
+
+# Soil type order for the coefficient lookup arrays used in batch mode
+SOIL_TYPES = ('sandy', 'loamy', 'clay')
+
+
+def _coefficient_array(coefficients: Dict) -> np.ndarray:
+    """Arrange a {nutrient: {soil_type: coef}} table as a (3, 3) N/P/K x soil array."""
+    return np.array([
+        [coefficients[nutrient][soil] for soil in SOIL_TYPES]
+        for nutrient in ('N', 'P', 'K')
+    ])
 
 
 class RainfallNutrientDepletionModel:
@@ -64,6 +76,10 @@ class RainfallNutrientDepletionModel:
     # Assumed constant slope (degrees) - moderate agricultural land
     DEFAULT_SLOPE = 3.0  # 3 degree slope (~5% grade)
     
+    # Coefficient tables as arrays for batch mode
+    _LEACHING_ARRAY = _coefficient_array(LEACHING_COEFFICIENTS)
+    _RUNOFF_ARRAY = _coefficient_array(RUNOFF_COEFFICIENTS)
+    
     def __init__(self):
         """Initialize RINDM model."""
         pass
@@ -259,6 +275,81 @@ class RainfallNutrientDepletionModel:
             }
         }
     
+    def calculate_nutrient_loss_batch(
+        self,
+        rainfall_mm: Sequence[float],
+        duration_hours: Sequence[float],
+        N_current: Sequence[float],
+        P_current: Sequence[float],
+        K_current: Sequence[float],
+        soil_type: Sequence[str],
+        slope_degrees: Union[float, Sequence[float]] = DEFAULT_SLOPE
+    ) -> Dict[str, np.ndarray]:
+        """
+        Calculate nutrient loss for many rainfall events at once.
+        
+        Element i of every input describes one event; the math is the same as
+        calculate_nutrient_loss in simple (soil_type) mode, evaluated with
+        NumPy over all events together.
+        
+        Args:
+            rainfall_mm: Total rainfall per event in mm
+            duration_hours: Duration per event in hours
+            N_current, P_current, K_current: Nutrient levels before each event (kg/ha)
+            soil_type: "sandy", "loamy", or "clay" per event
+            slope_degrees: Field slope in degrees, one for all events or one per event
+                (default: 3.0)
+            
+        Returns:
+            Dictionary of arrays: N_loss, P_loss, K_loss, N_remaining,
+            P_remaining, K_remaining (rounded to 2 decimals like the scalar version)
+        """
+        rainfall = np.asarray(rainfall_mm, dtype=np.float64)
+        duration = np.asarray(duration_hours, dtype=np.float64)
+        # Rows N, P, K; one column per event
+        current = np.array([N_current, P_current, K_current], dtype=np.float64)
+        
+        if np.any(rainfall < 0):
+            raise ValueError("Rainfall cannot be negative")
+        if np.any(duration < 0):
+            raise ValueError("Duration cannot be negative")
+        if np.any(current < 0):
+            raise ValueError("Nutrient levels cannot be negative")
+        
+        soil_index = {name: i for i, name in enumerate(SOIL_TYPES)}
+        try:
+            soil_codes = np.array([soil_index[s] for s in soil_type], dtype=np.intp)
+        except KeyError as e:
+            raise ValueError(f"Invalid soil_type: {e.args[0]}")
+        
+        # Same factors as the scalar path; zero duration falls back to 0.5
+        with np.errstate(divide='ignore', invalid='ignore'):
+            intensity_factor = np.where(
+                duration > 0,
+                np.minimum(1.0, rainfall / duration / 25.0),
+                0.5
+            )
+        # Same formula as _calculate_slope_factor, for a scalar or per-event slope
+        slope_factor = 1.0 + np.minimum(np.asarray(slope_degrees, dtype=np.float64) / 15.0, 1.0)
+        rainfall_factor = rainfall / 100.0
+        
+        leaching_loss = current * self._LEACHING_ARRAY[:, soil_codes] * rainfall_factor
+        runoff_loss = current * self._RUNOFF_ARRAY[:, soil_codes] * intensity_factor * slope_factor
+        
+        # Never lose more than is available
+        total_loss = np.minimum(leaching_loss + runoff_loss, current)
+        remaining = np.round(current - total_loss, 2)
+        total_loss = np.round(total_loss, 2)
+        
+        return {
+            'N_loss': total_loss[0],
+            'P_loss': total_loss[1],
+            'K_loss': total_loss[2],
+            'N_remaining': remaining[0],
+            'P_remaining': remaining[1],
+            'K_remaining': remaining[2]
+        }
+    
     def calculate_cumulative_loss(
         self,
         rainfall_events: list,
@@ -14,19 +14,141 @@ This service is the bridge between AI models and the farmer-facing API.
 """
 
 import sys
+from contextlib import contextmanager
 from pathlib import Path
 from datetime import date, timedelta
 from typing import Dict, List, Optional
 import numpy as np
 import pandas as pd
+import psycopg2
+from psycopg2 import OperationalError
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from database.db_utils import DatabaseManager
+from database.db_utils import DatabaseManager, get_shared_manager
 from src.models.time_series_data_manager import TimeSeriesDataManager
 from src.models.lstm_nutrient_predictor import LSTMNutrientPredictor
 from src.models.prophet_nutrient_forecaster import ProphetNutrientForecaster
 from src.utils.crop_nutrient_database import get_crop_nutrient_uptake
+from src.utils.nutrient_depletion import SEVERITY_LABELS, compute_depletion
+
+# (nutrient, crop_cycles column, time_series_predictions column)
+_NUTRIENT_KEYS = (
+    ('N', 'current_n_kg_ha', 'predicted_n_kg_ha'),
+    ('P', 'current_p_kg_ha', 'predicted_p_kg_ha'),
+    ('K', 'current_k_kg_ha', 'predicted_k_kg_ha'),
+)
+
+# 'reason' column text for soil_test_recommendations rows
+_WARNING_REASONS = {nutrient: f'Critical {nutrient} depletion' for nutrient, _, _ in _NUTRIENT_KEYS}
+
+# SQL statements, kept as module constants so every call sends identical text
+
+_SQL_FETCH_ACTIVE_CYCLE = """
+SELECT cc.*, f.farmer_id, f.field_id
+FROM crop_cycles cc
+JOIN fields f ON cc.field_id = f.field_id
+WHERE cc.cycle_id = %s AND cc.status = 'active'
+"""
+
+_SQL_FETCH_CURRENT_NPK = """
+SELECT current_n_kg_ha, current_p_kg_ha, current_k_kg_ha
+FROM crop_cycles
+WHERE cycle_id = %s
+"""
+
+_SQL_FETCH_LATEST_PRED = """
+SELECT * FROM time_series_predictions
+WHERE cycle_id = %s
+ORDER BY prediction_date DESC
+LIMIT 1
+"""
+
+_SQL_FETCH_CURRENT_NPK_BATCH = """
+SELECT cycle_id, current_n_kg_ha, current_p_kg_ha, current_k_kg_ha
+FROM crop_cycles
+WHERE cycle_id = ANY(%s)
+"""
+
+_SQL_FETCH_LATEST_PRED_BATCH = """
+SELECT DISTINCT ON (cycle_id) *
+FROM time_series_predictions
+WHERE cycle_id = ANY(%s)
+ORDER BY cycle_id, prediction_date DESC
+"""
+
+_SQL_COUNT_CYCLE_ROWS_BATCH = """
+SELECT cycle_id, COUNT(*) AS num_rows
+FROM daily_weather_nutrient_log
+WHERE cycle_id = ANY(%s)
+GROUP BY cycle_id
+"""
+
+_SQL_FETCH_CROP_HISTORY = """
+SELECT
+    crop_name,
+    COUNT(*) as num_cycles,
+    AVG(yield_kg_ha) as avg_yield,
+    AVG(final_n) as avg_final_n,
+    AVG(final_p) as avg_final_p,
+    AVG(final_k) as avg_final_k
+FROM cycle_performance_history
+WHERE farmer_id = %s AND field_id = %s
+GROUP BY crop_name
+ORDER BY avg_yield DESC
+"""
+
+_SQL_COUNT_CYCLE_ROWS = """
+SELECT COUNT(*) AS num_rows
+FROM daily_weather_nutrient_log
+WHERE cycle_id = %s
+"""
+
+_SQL_INSERT_PREDICTION = """
+INSERT INTO time_series_predictions (
+    cycle_id, farmer_id, prediction_date,
+    forecast_days_ahead, predicted_n_kg_ha,
+    predicted_p_kg_ha, predicted_k_kg_ha,
+    model_type, model_version, prediction_status
+) VALUES (%s, %s, CURRENT_TIMESTAMP, %s, %s, %s, %s, %s, %s, 'generated')
+"""
+
+_SQL_INSERT_WARNING = """
+INSERT INTO soil_test_recommendations (
+    cycle_id, farmer_id, recommendation_date,
+    reason, current_n_kg_ha, current_p_kg_ha,
+    current_k_kg_ha, message, status
+) SELECT cycle_id, farmer_id, CURRENT_TIMESTAMP,
+         %s, current_n_kg_ha, current_p_kg_ha,
+         current_k_kg_ha, %s, 'pending'
+FROM crop_cycles WHERE cycle_id = %s
+"""
+
+_SQL_FETCH_FIELD_SOIL = """
+SELECT current_n_kg_ha, current_p_kg_ha, current_k_kg_ha
+FROM crop_cycles
+WHERE farmer_id = $1 AND field_id = $2
+AND status = 'active'
+ORDER BY cycle_id DESC
+LIMIT 1
+"""
+
+
+@contextmanager
+def _savepoint(cursor, name: str):
+    """
+    Run the enclosed statements inside a SAVEPOINT.
+    
+    A failure rolls back only those statements, so callers that catch the
+    error leave the surrounding transaction usable instead of aborted.
+    """
+    cursor.execute(f"SAVEPOINT {name}")
+    try:
+        yield
+    except Exception:
+        cursor.execute(f"ROLLBACK TO SAVEPOINT {name}")
+        raise
+    cursor.execute(f"RELEASE SAVEPOINT {name}")
 
 
 class PredictiveCycleAdvisor:
@@ -36,6 +158,7 @@ class PredictiveCycleAdvisor:
     Key Methods:
     - generate_cycle_predictions(): Create LSTM + Prophet forecasts
     - generate_early_warnings(): Alert farmer before critical depletion
+    - generate_early_warnings_batch(): Same alerts for many cycles at once
     - suggest_next_cycle_crop(): Recommend next crop based on history
     """
     
@@ -51,6 +174,12 @@ class PredictiveCycleAdvisor:
         'K': 80
     }
     
+    # Positional (N=0, P=1, K=2) read-only copies for the depletion kernel
+    _CRIT_ARR = np.array(list(CRITICAL_THRESHOLDS.values()), dtype=np.float64)
+    _CRIT_ARR.setflags(write=False)
+    _WARN_ARR = np.array(list(WARNING_THRESHOLDS.values()), dtype=np.float64)
+    _WARN_ARR.setflags(write=False)
+    
     def __init__(
         self,
         db_manager: DatabaseManager = None,
@@ -61,11 +190,11 @@ class PredictiveCycleAdvisor:
         Initialize advisor with database and models.
         
         Args:
-            db_manager: Database connection
+            db_manager: Database connection (default: the shared manager)
             models_path: Path to save/load models
             use_pretrained: Load pre-trained models if available
         """
-        self.db = db_manager or DatabaseManager()
+        self.db = db_manager or get_shared_manager()
         self.ts = TimeSeriesDataManager(self.db)
         self.models_path = models_path
         
@@ -123,23 +252,30 @@ class PredictiveCycleAdvisor:
                 print(f"Prophet says: {result['prophet']['N'][0]}")
         """
         try:
-            # Validate cycle exists and is active
+            # Fail fast with 'Database unavailable' if the pool can't reach the server
+            self.db.ping()
+            
+            # Validate cycle exists and is active; the connection goes back to
+            # the pool before the data load and model inference below
             with self.db.get_connection() as (conn, cursor):
-                cursor.execute("""
-                    SELECT cc.*, f.farmer_id, f.field_id
-                    FROM crop_cycles cc
-                    JOIN fields f ON cc.field_id = f.field_id
-                    WHERE cc.cycle_id = %s AND cc.status = 'active'
-                """, (cycle_id,))
-                
-                cycle_row = cursor.fetchone()
-                if not cycle_row:
-                    return {
-                        'success': False,
-                        'error': f'Cycle {cycle_id} not found or not active'
-                    }
+                cursor.execute(_SQL_FETCH_ACTIVE_CYCLE, (cycle_id,))
                 
-                cycle = dict(cycle_row)
+                cycle = cursor.fetchone()
+            
+            if not cycle:
+                return {
+                    'success': False,
+                    'error': f'Cycle {cycle_id} not found or not active'
+                }
+            
+            # Nothing to predict with - skip the data load and the save
+            lstm_ready = self.lstm is not None and self.lstm.model is not None
+            prophet_ready = self.prophet is not None and self.prophet.is_trained
+            if not lstm_ready and not prophet_ready:
+                return {
+                    'success': False,
+                    'error': 'no trained models available'
+                }
             
             predictions = {
                 'success': True,
@@ -158,9 +294,11 @@ class PredictiveCycleAdvisor:
                 }
             
             # LSTM Predictions (grain-level, 7 days)
-            if self.lstm and self.lstm.model is not None:
+            if lstm_ready:
                 try:
-                    lstm_result = self.lstm.predict_next_days(recent_data)
+                    lstm_result = self.lstm.predict_next_days_from_array(
+                        recent_data[self.lstm.FEATURES].to_numpy(dtype=np.float32)
+                    )
                     predictions['lstm'] = lstm_result
                 except Exception as e:
                     predictions['lstm'] = {'error': str(e)}
@@ -168,7 +306,7 @@ class PredictiveCycleAdvisor:
                 predictions['lstm'] = {'status': 'model_not_trained'}
             
             # Prophet Predictions (seasonal, 30 days)
-            if self.prophet and self.prophet.is_trained:
+            if prophet_ready:
                 try:
                     prophet_result = self.prophet.forecast_next_days(days_ahead=30)
                     predictions['prophet'] = prophet_result
@@ -177,10 +315,12 @@ class PredictiveCycleAdvisor:
             else:
                 predictions['prophet'] = {'status': 'model_not_trained'}
             
-            # Save predictions to database
+            # Save predictions to database on a short connection of its own
             self._save_predictions_to_db(cycle_id, cycle['farmer_id'], predictions)
             
             return predictions
+        except OperationalError as e:
+            return {'success': False, 'error': f'Database unavailable: {e}'}
             
         except Exception as e:
             return {'success': False, 'error': str(e)}
@@ -212,107 +352,161 @@ class PredictiveCycleAdvisor:
         Returns:
             List of warning dictionaries, sorted by severity
         """
-        warnings = []
-        
         try:
-            # Get current cycle state
+            self.db.ping()
+            
+            # One connection covers the reads and the warning insert
             with self.db.get_connection() as (conn, cursor):
-                cursor.execute("""
-                    SELECT current_n_kg_ha, current_p_kg_ha, current_k_kg_ha
-                    FROM crop_cycles
-                    WHERE cycle_id = %s
-                """, (cycle_id,))
+                # Get current cycle state
+                cursor.execute(_SQL_FETCH_CURRENT_NPK, (cycle_id,))
                 
                 current = cursor.fetchone()
                 if not current:
                     return []
                 
-                current = dict(current)
-            
-            # Get latest predictions
-            with self.db.get_connection() as (conn, cursor):
-                cursor.execute("""
-                    SELECT * FROM time_series_predictions
-                    WHERE cycle_id = %s
-                    ORDER BY prediction_date DESC
-                    LIMIT 1
-                """, (cycle_id,))
+                # Get latest predictions
+                cursor.execute(_SQL_FETCH_LATEST_PRED, (cycle_id,))
                 
-                prediction_row = cursor.fetchone()
-                if not prediction_row:
+                prediction = cursor.fetchone()
+                if not prediction:
                     return []
                 
-                prediction = dict(prediction_row)
-            
-            # Check each nutrient against thresholds
-            for nutrient in ['N', 'P', 'K']:
-                current_key = f'current_{nutrient.lower()}_kg_ha'
-                pred_key = f'predicted_{nutrient.lower()}_kg_ha'
-                
-                current_level = current[current_key]
-                predicted_level = prediction[pred_key]
-                critical_threshold = self.CRITICAL_THRESHOLDS[nutrient]
-                warning_threshold = self.WARNING_THRESHOLDS[nutrient]
+                current_levels = np.array(
+                    [current[current_key] for _, current_key, _ in _NUTRIENT_KEYS],
+                    dtype=np.float64
+                )
+                predicted_levels = np.array(
+                    [
+                        np.nan if prediction[pred_key] is None else prediction[pred_key]
+                        for _, _, pred_key in _NUTRIENT_KEYS
+                    ],
+                    dtype=np.float64
+                )
+                # Depletion rate needs recent history; only look it up when some
+                # nutrient is already predicted below its critical level
+                has_history = False
+                if np.any(predicted_levels < self._CRIT_ARR):
+                    has_history = self._count_cycle_rows(cycle_id, cursor=cursor) > 7
                 
-                if predicted_level is None:
-                    continue
+                days, severity_idx = compute_depletion(
+                    current_levels, predicted_levels, self._CRIT_ARR, self._WARN_ARR,
+                    np.full(len(_NUTRIENT_KEYS), has_history)
+                )
                 
-                # Calculate days until critical
-                if predicted_level < critical_threshold:
-                    # Estimate depletion rate from recent data
-                    recent = self.ts.get_cycle_data(cycle_id)
-                    if len(recent) > 7:
-                        daily_loss = (current_level - predicted_level) / 7
-                        days_until_critical = int(
-                            (critical_threshold - predicted_level) / max(daily_loss, 0.1)
-                        )
-                    else:
-                        days_until_critical = 7
-                    
-                    # Determine severity
-                    if days_until_critical <= 3:
-                        severity = 'critical'
-                    elif days_until_critical <= 7:
-                        severity = 'urgent'
-                    else:
-                        severity = 'warning'
-                    
-                    warnings.append({
-                        'nutrient': nutrient,
-                        'current_level': float(current_level),
-                        'predicted_level': float(predicted_level),
-                        'critical_threshold': critical_threshold,
-                        'days_until_critical': max(1, days_until_critical),
-                        'severity': severity,
-                        'recommendation': self._get_nutrient_recommendation(
-                            nutrient, days_until_critical
-                        )
-                    })
+                warnings = self._build_warnings(
+                    current_levels, predicted_levels, days, severity_idx
+                )
                 
-                elif predicted_level < warning_threshold:
-                    warnings.append({
-                        'nutrient': nutrient,
-                        'current_level': float(current_level),
-                        'predicted_level': float(predicted_level),
-                        'critical_threshold': critical_threshold,
-                        'severity': 'monitor',
-                        'recommendation': f'Monitor {nutrient} levels closely. Plan fertilizer application if depletion continues.'
-                    })
-            
-            # Sort by severity
-            severity_order = {'critical': 0, 'urgent': 1, 'warning': 2, 'monitor': 3}
-            warnings.sort(key=lambda w: severity_order.get(w['severity'], 99))
-            
-            # Save warnings to database if any critical
-            if any(w['severity'] in ['critical', 'urgent'] for w in warnings):
-                self._save_warnings_to_db(cycle_id, warnings)
+                # Save warnings to database if any critical (list is sorted,
+                # so the first entry carries the highest severity)
+                if warnings and warnings[0]['severity'] in ('critical', 'urgent'):
+                    self._save_warnings_to_db(cycle_id, warnings, cursor=cursor)
             
             return warnings
+        except OperationalError as e:
+            print(f"Database unavailable, cannot generate warnings: {e}")
+            return []
             
         except Exception as e:
             print(f"Error generating warnings: {e}")
             return []
     
+    def generate_early_warnings_batch(self, cycle_ids: List[int]) -> Dict[int, List[Dict]]:
+        """
+        Generate early warnings for many cycles in one pass.
+        
+        Called by: farm-level dashboards that show every active cycle
+        
+        Uses three queries in total (cycle states, latest predictions and,
+        only if something is below critical, history counts) and scores all
+        cycles with a single depletion-kernel call.
+        
+        Args:
+            cycle_ids: Crop cycle IDs to check
+        
+        Returns:
+            {cycle_id: [warnings...]} with each list in the same format as
+            generate_early_warnings(). Cycles without a state or prediction
+            map to an empty list.
+        """
+        cycle_ids = list(dict.fromkeys(cycle_ids))
+        results = {cycle_id: [] for cycle_id in cycle_ids}
+        if not cycle_ids:
+            return results
+        
+        try:
+            self.db.ping()
+            
+            with self.db.get_connection() as (conn, cursor):
+                cursor.execute(_SQL_FETCH_CURRENT_NPK_BATCH, (cycle_ids,))
+                current_rows = {row['cycle_id']: row for row in cursor.fetchall()}
+                
+                cursor.execute(_SQL_FETCH_LATEST_PRED_BATCH, (cycle_ids,))
+                prediction_rows = {row['cycle_id']: row for row in cursor.fetchall()}
+                
+                # Only cycles with both a state and a prediction can be scored
+                scored_ids = [
+                    c for c in cycle_ids if c in current_rows and c in prediction_rows
+                ]
+                if not scored_ids:
+                    return results
+                
+                # (M, 3) matrices, one row per cycle in N, P, K order
+                current = np.array(
+                    [
+                        [current_rows[c][current_key] for _, current_key, _ in _NUTRIENT_KEYS]
+                        for c in scored_ids
+                    ],
+                    dtype=np.float64
+                )
+                predicted = np.array(
+                    [
+                        [
+                            np.nan if prediction_rows[c][pred_key] is None
+                            else prediction_rows[c][pred_key]
+                            for _, _, pred_key in _NUTRIENT_KEYS
+                        ]
+                        for c in scored_ids
+                    ],
+                    dtype=np.float64
+                )
+                
+                # History counts are only needed where something is below critical
+                below_critical = (predicted < self._CRIT_ARR).any(axis=1)
+                has_history = np.zeros(len(scored_ids), dtype=np.bool_)
+                if below_critical.any():
+                    depleted_ids = [c for c, below in zip(scored_ids, below_critical) if below]
+                    cursor.execute(_SQL_COUNT_CYCLE_ROWS_BATCH, (depleted_ids,))
+                    counts = {row['cycle_id']: row['num_rows'] for row in cursor.fetchall()}
+                    has_history = np.array([counts.get(c, 0) > 7 for c in scored_ids])
+                
+                num_cycles, num_nutrients = current.shape
+                days, severity_idx = compute_depletion(
+                    current.ravel(), predicted.ravel(),
+                    np.tile(self._CRIT_ARR, num_cycles),
+                    np.tile(self._WARN_ARR, num_cycles),
+                    np.repeat(has_history, num_nutrients)
+                )
+                days = days.reshape(num_cycles, num_nutrients)
+                severity_idx = severity_idx.reshape(num_cycles, num_nutrients)
+                
+                for row, cycle_id in enumerate(scored_ids):
+                    warnings = self._build_warnings(
+                        current[row], predicted[row], days[row], severity_idx[row]
+                    )
+                    if warnings and warnings[0]['severity'] in ('critical', 'urgent'):
+                        self._save_warnings_to_db(cycle_id, warnings, cursor=cursor)
+                    results[cycle_id] = warnings
+            
+            return results
+        except OperationalError as e:
+            print(f"Database unavailable, cannot generate batch warnings: {e}")
+            return {cycle_id: [] for cycle_id in cycle_ids}
+            
+        except Exception as e:
+            print(f"Error generating batch warnings: {e}")
+            return {cycle_id: [] for cycle_id in cycle_ids}
+    
     def suggest_next_cycle_crop(
         self,
         farmer_id: int,
@@ -355,23 +549,13 @@ class PredictiveCycleAdvisor:
             # Suggest Wheat (92% confidence), Rice (78% confidence), Maize (65%)
         """
         try:
+            self.db.ping()
+            
             # Get crop history for this field
             with self.db.get_connection() as (conn, cursor):
-                cursor.execute("""
-                    SELECT 
-                        crop_name,
-                        COUNT(*) as num_cycles,
-                        AVG(yield_kg_ha) as avg_yield,
-                        AVG(final_n) as avg_final_n,
-                        AVG(final_p) as avg_final_p,
-                        AVG(final_k) as avg_final_k
-                    FROM cycle_performance_history
-                    WHERE farmer_id = %s AND field_id = %s
-                    GROUP BY crop_name
-                    ORDER BY avg_yield DESC
-                """, (farmer_id, field_id))
+                cursor.execute(_SQL_FETCH_CROP_HISTORY, (farmer_id, field_id))
                 
-                crop_history = [dict(r) for r in cursor.fetchall()]
+                crop_history = cursor.fetchall()
             
             if not crop_history:
                 return {
@@ -407,6 +591,8 @@ class PredictiveCycleAdvisor:
                 'current_soil': current_soil,
                 'recommendations': recommendations
             }
+        except OperationalError as e:
+            return {'success': False, 'error': f'Database unavailable: {e}'}
             
         except Exception as e:
             return {'success': False, 'error': str(e)}
@@ -415,6 +601,56 @@ class PredictiveCycleAdvisor:
     # HELPER METHODS
     # ============================================================================
     
+    def _build_warnings(
+        self,
+        current_levels: np.ndarray,
+        predicted_levels: np.ndarray,
+        days: np.ndarray,
+        severity_idx: np.ndarray
+    ) -> List[Dict]:
+        """
+        Turn depletion-kernel output for one cycle into warning dicts.
+        
+        Warnings are bucketed by severity as they are built, so the list
+        comes out ordered without a sort pass.
+        """
+        buckets = {'critical': [], 'urgent': [], 'warning': [], 'monitor': []}
+        
+        for i, (nutrient, _, _) in enumerate(_NUTRIENT_KEYS):
+            if severity_idx[i] < 0:
+                continue
+            
+            severity = SEVERITY_LABELS[severity_idx[i]]
+            critical_threshold = int(self._CRIT_ARR[i])
+            
+            if severity == 'monitor':
+                buckets['monitor'].append({
+                    'nutrient': nutrient,
+                    'current_level': float(current_levels[i]),
+                    'predicted_level': float(predicted_levels[i]),
+                    'critical_threshold': critical_threshold,
+                    'severity': 'monitor',
+                    'recommendation': f'Monitor {nutrient} levels closely. Plan fertilizer application if depletion continues.'
+                })
+            else:
+                days_until_critical = int(days[i])
+                buckets[severity].append({
+                    'nutrient': nutrient,
+                    'current_level': float(current_levels[i]),
+                    'predicted_level': float(predicted_levels[i]),
+                    'critical_threshold': critical_threshold,
+                    'days_until_critical': max(1, days_until_critical),
+                    'severity': severity,
+                    'recommendation': self._get_nutrient_recommendation(
+                        nutrient, days_until_critical
+                    )
+                })
+        
+        return (
+            buckets['critical'] + buckets['urgent'] +
+            buckets['warning'] + buckets['monitor']
+        )
+    
     def _get_nutrient_recommendation(self, nutrient: str, days_until_critical: int) -> str:
         """Get human-friendly recommendation for nutrient depletion."""
         actions = {
@@ -432,25 +668,46 @@ class PredictiveCycleAdvisor:
         else:
             return f'Schedule application of {fertilizer} within 1-2 weeks'
     
-    def _save_predictions_to_db(self, cycle_id: int, farmer_id: int, predictions: Dict):
-        """Store predictions in database for historical tracking."""
-        try:
+    def _count_cycle_rows(self, cycle_id: int, cursor=None) -> int:
+        """Count logged daily observations for a cycle without loading them."""
+        if cursor is None:
             with self.db.get_connection() as (conn, cursor):
-                # Extract key predictions
-                lstm_pred = predictions.get('lstm', {})
-                prophet_pred = predictions.get('prophet', {})
-                
-                # Store only first forecast day for simplicity
-                lstm_data = lstm_pred.get('predictions', [{}])[0] if 'predictions' in lstm_pred else {}
-                
-                cursor.execute("""
-                    INSERT INTO time_series_predictions (
-                        cycle_id, farmer_id, prediction_date,
-                        forecast_days_ahead, predicted_n_kg_ha,
-                        predicted_p_kg_ha, predicted_k_kg_ha,
-                        model_type, model_version, prediction_status
-                    ) VALUES (%s, %s, CURRENT_TIMESTAMP, %s, %s, %s, %s, %s, %s, 'generated')
-                """, (
+                return self._count_cycle_rows(cycle_id, cursor=cursor)
+        
+        cursor.execute(_SQL_COUNT_CYCLE_ROWS, (cycle_id,))
+        
+        return int(cursor.fetchone()['num_rows'])
+    
+    def _save_predictions_to_db(
+        self,
+        cycle_id: int,
+        farmer_id: int,
+        predictions: Dict,
+        cursor=None
+    ):
+        """
+        Store predictions in database for historical tracking.
+        
+        Pass the caller's cursor to reuse its connection; otherwise a new
+        connection is opened. A failed insert is rolled back to a savepoint
+        and reported, leaving the caller's transaction intact.
+        """
+        if cursor is None:
+            with self.db.get_connection() as (conn, cursor):
+                return self._save_predictions_to_db(
+                    cycle_id, farmer_id, predictions, cursor=cursor
+                )
+        
+        try:
+            # Extract key predictions
+            lstm_pred = predictions.get('lstm', {})
+            prophet_pred = predictions.get('prophet', {})
+            
+            # Store only first forecast day for simplicity
+            lstm_data = lstm_pred.get('predictions', [{}])[0] if 'predictions' in lstm_pred else {}
+            
+            with _savepoint(cursor, 'save_predictions'):
+                cursor.execute(_SQL_INSERT_PREDICTION, (
                     cycle_id, farmer_id, 7,
                     lstm_data.get('predicted_n'),
                     lstm_data.get('predicted_p'),
@@ -461,24 +718,26 @@ class PredictiveCycleAdvisor:
         except Exception as e:
             print(f"Warning: Could not save predictions: {e}")
     
-    def _save_warnings_to_db(self, cycle_id: int, warnings: List[Dict]):
-        \"\"\"Store critical/urgent warnings in database.\"\"\"
+    def _save_warnings_to_db(self, cycle_id: int, warnings: List[Dict], cursor=None):
+        """
+        Store critical/urgent warnings in database.
+        
+        Pass the caller's cursor to reuse its connection; otherwise a new
+        connection is opened. A failed insert is rolled back to a savepoint
+        and reported, so one cycle's failure does not abort the transaction
+        shared by a batch.
+        """
+        if cursor is None:
+            with self.db.get_connection() as (conn, cursor):
+                return self._save_warnings_to_db(cycle_id, warnings, cursor=cursor)
+        
         try:
             critical_warnings = [w for w in warnings if w['severity'] in ['critical', 'urgent']]
             
-            with self.db.get_connection() as (conn, cursor):
+            with _savepoint(cursor, 'save_warnings'):
                 for warning in critical_warnings:
-                    cursor.execute(\"\"\"
-                        INSERT INTO soil_test_recommendations (
-                            cycle_id, farmer_id, recommendation_date,
-                            reason, current_n_kg_ha, current_p_kg_ha,
-                            current_k_kg_ha, message, status
-                        ) SELECT cycle_id, farmer_id, CURRENT_TIMESTAMP,
-                                 %s, current_n_kg_ha, current_p_kg_ha,
-                                 current_k_kg_ha, %s, 'pending'
-                        FROM crop_cycles WHERE cycle_id = %s
-                    \"\"\", (
-                        f'Critical {warning[\"nutrient\"]} depletion',
+                    cursor.execute(_SQL_INSERT_WARNING, (
+                        _WARNING_REASONS[warning['nutrient']],
                         warning['recommendation'],
                         cycle_id
                     ))
@@ -486,27 +745,21 @@ class PredictiveCycleAdvisor:
             print(f"Warning: Could not save warnings: {e}")
     
     def _get_current_field_soil(self, farmer_id: int, field_id: int) -> Dict:
-        \"\"\"Get current soil status for a field.\"\"\"
+        """Get current soil status for a field."""
         try:
             with self.db.get_connection() as (conn, cursor):
-                cursor.execute(\"\"\"
-                    SELECT current_n_kg_ha, current_p_kg_ha, current_k_kg_ha
-                    FROM crop_cycles
-                    WHERE farmer_id = %s AND field_id = %s
-                    AND status = 'active'
-                    ORDER BY cycle_id DESC
-                    LIMIT 1
-                \"\"\", (farmer_id, field_id))
+                self.db.execute_prepared(
+                    cursor, 'get_field_soil', _SQL_FETCH_FIELD_SOIL, (farmer_id, field_id)
+                )
                 
-                result = cursor.fetchone()
-                if result:
-                    r = dict(result)
+                r = cursor.fetchone()
+                if r:
                     return {
                         'N': r['current_n_kg_ha'],
                         'P': r['current_p_kg_ha'],
                         'K': r['current_k_kg_ha']
                     }
-        except:
-            pass
+        except (psycopg2.Error, KeyError) as e:
+            print(f"Warning: Could not read current field soil, using defaults: {e}")
         
         return {'N': 100, 'P': 30, 'K': 150}  # Default estimates
@@ -10,23 +10,83 @@ Manages the complete RINDM cycle workflow:
 6. Complete cycle and suggest next crop
 """
 
-import sys
-from pathlib import Path
+from collections import defaultdict
 from datetime import datetime, date, timedelta
-from typing import Dict, List, Optional, Tuple
-import time
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from psycopg2.extras import execute_values, Json, NamedTupleCursor
 
-# Add backend to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
-from src.models.rindm import RainfallNutrientDepletionModel
+# Imported as src.services.rindm_cycle_manager by entry points that already
+# have backend/ on sys.path (app_v2.py, src/services/weather_monitor.py)
+from src.models.rindm import RainfallNutrientDepletionModel, SOIL_TYPES
 from src.utils.crop_nutrient_database import (
     get_crop_nutrient_uptake,
     check_nutrient_status,
     calculate_remaining_nutrients
 )
-from src.utils.weather_fetcher import WeatherAPIFetcher
-from database.db_utils import DatabaseManager
+from src.utils.weather_fetcher import WeatherAPIFetcher, location_key
+from database.db_utils import DatabaseManager, get_shared_manager
+
+# Rainfall-path statements, run through DatabaseManager.execute_prepared
+_SQL_INSERT_RAINFALL_EVENT = """
+    INSERT INTO rainfall_events (
+        cycle_id, event_start, rainfall_mm, duration_hours,
+        intensity_mm_per_hour,
+        n_before_event, p_before_event, k_before_event,
+        nutrient_loss_n, nutrient_loss_p, nutrient_loss_k,
+        n_after_event, p_after_event, k_after_event,
+        processed, processed_at
+    )
+    VALUES (
+        $1, CURRENT_TIMESTAMP, $2, $3, $4,
+        $5, $6, $7,
+        $8, $9, $10,
+        $11, $12, $13,
+        TRUE, CURRENT_TIMESTAMP
+    )
+    RETURNING event_id
+"""
+
+_SQL_UPDATE_CYCLE_RAINFALL = """
+    UPDATE crop_cycles
+    SET current_n_kg_ha = $1,
+        current_p_kg_ha = $2,
+        current_k_kg_ha = $3,
+        total_rainfall_loss_n = COALESCE(total_rainfall_loss_n, 0) + $4,
+        total_rainfall_loss_p = COALESCE(total_rainfall_loss_p, 0) + $5,
+        total_rainfall_loss_k = COALESCE(total_rainfall_loss_k, 0) + $6,
+        rainfall_event_count = COALESCE(rainfall_event_count, 0) + 1,
+        last_weather_check = CURRENT_TIMESTAMP
+    WHERE cycle_id = $7
+    RETURNING farmer_id
+"""
+
+_SQL_INSERT_SOIL_TEST = """
+    INSERT INTO soil_test_recommendations (
+        cycle_id, farmer_id, reason,
+        current_n_kg_ha, current_p_kg_ha, current_k_kg_ha,
+        message, status
+    )
+    VALUES ($1, $2, $3, $4, $5, $6, $7, 'pending')
+"""
+
+
+class ActiveCycle(NamedTuple):
+    """An active cycle as listed for weather monitoring."""
+    cycle_id: int
+    farmer_id: int
+    crop_name: str
+    soil_type: str
+    start_date: date
+    expected_end_date: date
+    current_n_kg_ha: float
+    current_p_kg_ha: float
+    current_k_kg_ha: float
+    last_weather_check: Optional[datetime]
+    latitude: Optional[float]
+    longitude: Optional[float]
+    should_complete: bool = False
 
 
 class RINDMCycleManager:
@@ -35,8 +95,13 @@ class RINDMCycleManager:
     """
     
     def __init__(self, db_manager: DatabaseManager = None):
-        """Initialize cycle manager."""
-        self.db = db_manager or DatabaseManager()
+        """
+        Initialize cycle manager.
+        
+        Args:
+            db_manager: Database manager (default: the process-wide shared manager)
+        """
+        self.db = db_manager or get_shared_manager()
         self.rindm = RainfallNutrientDepletionModel()
         self.weather = WeatherAPIFetcher()
         
@@ -46,6 +111,82 @@ class RINDMCycleManager:
             'P': 10,
             'K': 40
         }
+        
+        # Dry cycles from batch checks whose last_weather_check is still unstamped
+        self._heartbeat_buffer: List[int] = []
+        self._buffer_lock = threading.Lock()
+    
+    @staticmethod
+    def _record_measurement(
+        cursor,
+        cycle_id: int,
+        measurement_type: str,
+        n_kg_ha: float,
+        p_kg_ha: float,
+        k_kg_ha: float,
+        below_threshold: bool,
+        notes: str = None,
+        details: Dict = None
+    ):
+        """Insert one nutrient measurement (details is stored as JSONB)."""
+        cursor.execute("""
+            INSERT INTO nutrient_measurements (
+                cycle_id, measurement_type, n_kg_ha, p_kg_ha, k_kg_ha,
+                below_threshold, notes, details
+            )
+            VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+        """, (
+            cycle_id, measurement_type, n_kg_ha, p_kg_ha, k_kg_ha,
+            below_threshold, notes,
+            Json(details) if details is not None else None
+        ))
+    
+    @staticmethod
+    def _insert_measurements(cursor, rows: List[Tuple]) -> int:
+        """Insert many measurement tuples (columns as in _record_measurement) in one statement."""
+        if not rows:
+            return 0
+        
+        execute_values(cursor, """
+            INSERT INTO nutrient_measurements (
+                cycle_id, measurement_type, n_kg_ha, p_kg_ha, k_kg_ha,
+                below_threshold, notes, details
+            )
+            VALUES %s
+        """, rows, page_size=1000)
+        
+        return len(rows)
+    
+    def flush_heartbeats(self, cursor=None) -> int:
+        """
+        Stamp last_weather_check for the dry cycles buffered by a batch check in one UPDATE.
+        
+        Args:
+            cursor: Cursor of an open transaction; a new connection is used if omitted
+        
+        Returns:
+            Number of cycles stamped
+        """
+        if not self._heartbeat_buffer:
+            return 0
+        
+        if cursor is None:
+            with self.db.get_connection() as (conn, cursor):
+                return self.flush_heartbeats(cursor=cursor)
+        
+        with self._buffer_lock:
+            cycle_ids, self._heartbeat_buffer = self._heartbeat_buffer, []
+        
+        if not cycle_ids:
+            return 0
+        
+        cursor.execute("""
+            UPDATE crop_cycles
+            SET last_weather_check = CURRENT_TIMESTAMP
+            WHERE cycle_id = ANY(%s)
+        """, (cycle_ids,))
+        
+        return len(cycle_ids)
     
     def start_new_cycle(
         self,
@@ -79,21 +220,13 @@ class RINDMCycleManager:
         if not crop_data:
             return {'success': False, 'error': f'Crop {selected_crop} not found'}
         
-        # Get current cycle number for this farmer
-        with self.db.get_connection() as (conn, cursor):
-            cursor.execute("""
-                SELECT COALESCE(MAX(cycle_number), 0) + 1 as next_cycle
-                FROM crop_cycles
-                WHERE farmer_id = %s
-            """, (farmer_id,))
-            cycle_number = cursor.fetchone()['next_cycle']
-        
         # Calculate expected end date
         start_date = date.today()
-        expected_end_date = start_date + timedelta(days=crop_data['cycle_days'])
+        expected_end_date = start_date + timedelta(days=crop_data.cycle_days)
         
-        # Create crop cycle
+        # Cycle insert and initial measurement share one transaction
         with self.db.get_connection() as (conn, cursor):
+            # Create crop cycle, numbering it after the farmer's latest cycle
             cursor.execute("""
                 INSERT INTO crop_cycles (
                     farmer_id, field_id, cycle_number, crop_name,
@@ -104,26 +237,29 @@ class RINDMCycleManager:
                     total_crop_uptake_n, total_crop_uptake_p, total_crop_uptake_k,
                     last_weather_check
                 )
-                VALUES (
-                    %s, %s, %s, %s,
+                SELECT
+                    %s, %s,
+                    COALESCE((SELECT MAX(cycle_number) FROM crop_cycles WHERE farmer_id = %s), 0) + 1,
+                    %s,
                     %s, %s, 'active',
                     %s, %s, %s, %s,
                     %s, %s, %s,
                     %s, %s,
                     %s, %s, %s,
                     CURRENT_TIMESTAMP
-                )
-                RETURNING cycle_id
+                RETURNING cycle_id, cycle_number
             """, (
-                farmer_id, field_id, cycle_number, selected_crop,
+                farmer_id, field_id, farmer_id, selected_crop,
                 start_date, expected_end_date,
                 initial_n, initial_p, initial_k, initial_ph,
                 initial_n, initial_p, initial_k,  # current = initial at start
                 soil_type, initial_ph,
-                crop_data['N_uptake_kg_ha'], crop_data['P_uptake_kg_ha'], crop_data['K_uptake_kg_ha']
+                crop_data.N_uptake_kg_ha, crop_data.P_uptake_kg_ha, crop_data.K_uptake_kg_ha
             ))
             
-            cycle_id = cursor.fetchone()['cycle_id']
+            row = cursor.fetchone()
+            cycle_id = row['cycle_id']
+            cycle_number = row['cycle_number']
             
             # Update recommendation if provided
             if recommendation_id:
@@ -134,13 +270,10 @@ class RINDMCycleManager:
                 """, (selected_crop, recommendation_id))
             
             # Record initial measurement
-            cursor.execute("""
-                INSERT INTO nutrient_measurements (
-                    cycle_id, measurement_type, n_kg_ha, p_kg_ha, k_kg_ha,
-                    below_threshold, notes
-                )
-                VALUES (%s, 'cycle_start', %s, %s, %s, FALSE, 'Cycle started')
-            """, (cycle_id, initial_n, initial_p, initial_k))
+            self._record_measurement(
+                cursor, cycle_id, 'cycle_start', initial_n, initial_p, initial_k,
+                False, 'Cycle started'
+            )
         
         return {
             'success': True,
@@ -149,16 +282,16 @@ class RINDMCycleManager:
             'crop': selected_crop,
             'start_date': str(start_date),
             'expected_end_date': str(expected_end_date),
-            'duration_days': crop_data['cycle_days'],
+            'duration_days': crop_data.cycle_days,
             'current_nutrients': {
                 'N': initial_n,
                 'P': initial_p,
                 'K': initial_k
             },
             'crop_requirements': {
-                'N': crop_data['N_uptake_kg_ha'],
-                'P': crop_data['P_uptake_kg_ha'],
-                'K': crop_data['K_uptake_kg_ha']
+                'N': crop_data.N_uptake_kg_ha,
+                'P': crop_data.P_uptake_kg_ha,
+                'K': crop_data.K_uptake_kg_ha
             }
         }
     
@@ -166,7 +299,10 @@ class RINDMCycleManager:
         """
         Check weather API for rainfall and process if detected.
         
-        This should be called periodically (e.g., every hour) for active cycles.
+        Handles a single cycle (e.g. a manual check from the API). Periodic
+        monitoring should not schedule this per cycle; the weather monitor
+        passes every active cycle to batch_check_and_process_rainfall, so
+        weather lookups are shared between cycles at the same location.
         
         Args:
             cycle_id: Active cycle ID
@@ -175,12 +311,16 @@ class RINDMCycleManager:
             Dictionary with rainfall status and nutrient updates
         """
         # Get cycle info with location from field
-        with self.db.get_connection() as (conn, cursor):
+        with self.db.get_connection(cursor_factory=NamedTupleCursor) as (conn, cursor):
             cursor.execute("""
                 SELECT 
-                    cc.*,
-                    f.latitude,
-                    f.longitude
+                    cc.farmer_id,
+                    cc.current_n_kg_ha,
+                    cc.current_p_kg_ha,
+                    cc.current_k_kg_ha,
+                    cc.soil_type,
+                    f.latitude::float8 AS latitude,
+                    f.longitude::float8 AS longitude
                 FROM crop_cycles cc
                 JOIN fields f ON cc.field_id = f.field_id
                 WHERE cc.cycle_id = %s AND cc.status = 'active'
@@ -189,11 +329,9 @@ class RINDMCycleManager:
             cycle = cursor.fetchone()
             if not cycle:
                 return {'success': False, 'error': 'Cycle not found or not active'}
-            
-            cycle = dict(cycle)
         
         # Validate coordinates exist
-        if not cycle.get('latitude') or not cycle.get('longitude'):
+        if not cycle.latitude or not cycle.longitude:
             return {
                 'success': False, 
                 'error': 'No location data found for field or farmer. Please update location information.'
@@ -202,8 +340,8 @@ class RINDMCycleManager:
         # Get current weather
         try:
             weather_data = self.weather.get_current_weather(
-                float(cycle['latitude']),
-                float(cycle['longitude'])
+                cycle.latitude,
+                cycle.longitude
             )
         except Exception as e:
             return {'success': False, 'error': f'Weather API error: {str(e)}'}
@@ -212,8 +350,8 @@ class RINDMCycleManager:
             # Fallback to mock data for testing
             print(f"Using mock weather data for testing (cycle_id={cycle_id})")
             weather_data = self.weather.get_mock_weather(
-                float(cycle['latitude']),
-                float(cycle['longitude'])
+                cycle.latitude,
+                cycle.longitude
             )
         
         # Check for rainfall
@@ -232,36 +370,207 @@ class RINDMCycleManager:
                 'success': True,
                 'rainfall_detected': False,
                 'message': 'No rainfall detected',
-                'weather': {
-                    'temperature': weather_data.get('temperature'),
-                    'humidity': weather_data.get('humidity'),
-                    'rainfall': rainfall_mm,
-                    'feels_like': weather_data.get('feels_like'),
-                    'pressure': weather_data.get('pressure'),
-                    'description': weather_data.get('description'),
-                    'timestamp': weather_data.get('timestamp')
-                },
-                'location': {
-                    'name': weather_data.get('location_name', 'Unknown'),
-                    'country': weather_data.get('country', ''),
-                    'latitude': float(cycle['latitude']),
-                    'longitude': float(cycle['longitude'])
-                }
+                **self._weather_details(weather_data, rainfall_mm, cycle.latitude, cycle.longitude)
             }
         
         # Rainfall detected! Process it
         return self.process_rainfall_event(
             cycle_id=cycle_id,
             rainfall_mm=rainfall_mm,
-            current_n=cycle['current_n_kg_ha'],
-            current_p=cycle['current_p_kg_ha'],
-            current_k=cycle['current_k_kg_ha'],
-            soil_type=cycle['soil_type'],
+            current_n=cycle.current_n_kg_ha,
+            current_p=cycle.current_p_kg_ha,
+            current_k=cycle.current_k_kg_ha,
+            soil_type=cycle.soil_type,
+            farmer_id=cycle.farmer_id,
             weather_data=weather_data,
-            latitude=float(cycle['latitude']),
-            longitude=float(cycle['longitude'])
+            latitude=cycle.latitude,
+            longitude=cycle.longitude
         )
     
+    def batch_check_and_process_rainfall(
+        self,
+        cycles: Sequence[ActiveCycle],
+        max_workers: int = 16,
+        duration_hours: float = 2.0
+    ) -> Dict[int, Dict]:
+        """
+        Check weather and apply rainfall depletion for many cycles at once.
+        
+        Weather is fetched once per location cell, losses for every cycle that
+        received rain come from one RINDM batch call, and all resulting writes
+        go out as multi-row statements in a single transaction. Cycles without
+        rain get one batched last_weather_check update, in that same
+        transaction when any cycle had rain.
+        
+        Args:
+            cycles: Active cycles to check
+            max_workers: Maximum number of concurrent weather API calls
+            duration_hours: Assumed rainfall duration (default 2 hours)
+            
+        Returns:
+            Dictionary mapping cycle_id to a result shaped like
+            check_and_process_rainfall's
+        """
+        results = {}
+        
+        # Step 1: group cycles by weather cache cell
+        by_location = defaultdict(list)
+        for cycle in cycles:
+            if not cycle.latitude or not cycle.longitude:
+                results[cycle.cycle_id] = {
+                    'success': False,
+                    'error': 'No location data found for field or farmer. Please update location information.'
+                }
+                continue
+            by_location[location_key(cycle.latitude, cycle.longitude)].append(cycle)
+        
+        if not by_location:
+            return results
+        
+        # Step 2: one weather fetch per cell, overlapped across cells
+        def fetch(group: List[ActiveCycle]):
+            latitude, longitude = float(group[0].latitude), float(group[0].longitude)
+            try:
+                weather_data = self.weather.get_current_weather(latitude, longitude)
+            except Exception as e:
+                return e
+            if not weather_data:
+                print(f"Using mock weather data for testing ({latitude}, {longitude})")
+                weather_data = self.weather.get_mock_weather(latitude, longitude)
+            return weather_data
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(by_location))) as executor:
+            weather_by_cell = dict(zip(by_location, executor.map(fetch, by_location.values())))
+        
+        rained = []
+        for cell, group in by_location.items():
+            weather_data = weather_by_cell[cell]
+            for cycle in group:
+                cycle_id = cycle.cycle_id
+                latitude, longitude = float(cycle.latitude), float(cycle.longitude)
+                
+                if isinstance(weather_data, Exception):
+                    results[cycle_id] = {'success': False, 'error': f'Weather API error: {str(weather_data)}'}
+                elif weather_data.get('rainfall', 0) <= 0:
+                    with self._buffer_lock:
+                        self._heartbeat_buffer.append(cycle_id)
+                    results[cycle_id] = {
+                        'success': True,
+                        'rainfall_detected': False,
+                        'message': 'No rainfall detected',
+                        **self._weather_details(weather_data, 0, latitude, longitude)
+                    }
+                elif cycle.soil_type not in SOIL_TYPES:
+                    results[cycle_id] = {'success': False, 'error': f"Invalid soil_type: {cycle.soil_type}"}
+                else:
+                    rained.append((cycle, weather_data))
+        
+        # Step 3: depletion for every rained-on cycle in one vectorized call
+        if rained:
+            rainfall = [float(weather_data['rainfall']) for _, weather_data in rained]
+            loss = self.rindm.calculate_nutrient_loss_batch(
+                rainfall_mm=rainfall,
+                duration_hours=[duration_hours] * len(rained),
+                N_current=[float(cycle.current_n_kg_ha) for cycle, _ in rained],
+                P_current=[float(cycle.current_p_kg_ha) for cycle, _ in rained],
+                K_current=[float(cycle.current_k_kg_ha) for cycle, _ in rained],
+                soil_type=[cycle.soil_type for cycle, _ in rained]
+            )
+            losses = list(zip(loss['N_loss'].tolist(), loss['P_loss'].tolist(), loss['K_loss'].tolist()))
+            remaining = list(zip(loss['N_remaining'].tolist(), loss['P_remaining'].tolist(), loss['K_remaining'].tolist()))
+            statuses = [check_nutrient_status(*npk) for npk in remaining]
+            
+            event_rows, cycle_rows, measurement_rows, soil_test_rows = [], [], [], []
+            for (cycle, _), rainfall_mm, (loss_n, loss_p, loss_k), (new_n, new_p, new_k), status in zip(
+                rained, rainfall, losses, remaining, statuses
+            ):
+                cycle_id = cycle.cycle_id
+                event_rows.append((
+                    cycle_id, rainfall_mm, duration_hours, rainfall_mm / duration_hours,
+                    cycle.current_n_kg_ha, cycle.current_p_kg_ha, cycle.current_k_kg_ha,
+                    loss_n, loss_p, loss_k,
+                    new_n, new_p, new_k
+                ))
+                cycle_rows.append((cycle_id, new_n, new_p, new_k, loss_n, loss_p, loss_k))
+                measurement_rows.append((
+                    cycle_id, 'rainfall_update', new_n, new_p, new_k,
+                    status['needs_soil_test'], None,
+                    Json({'rainfall_mm': rainfall_mm, 'losses': {'N': loss_n, 'P': loss_p, 'K': loss_k}})
+                ))
+                if status['needs_soil_test']:
+                    soil_test_rows.append((
+                        cycle_id, cycle.farmer_id, 'low_nutrients',
+                        new_n, new_p, new_k,
+                        status['soil_test_message']
+                    ))
+            
+            with self.db.get_connection() as (conn, cursor):
+                inserted = execute_values(cursor, """
+                    INSERT INTO rainfall_events (
+                        cycle_id, event_start, rainfall_mm, duration_hours,
+                        intensity_mm_per_hour,
+                        n_before_event, p_before_event, k_before_event,
+                        nutrient_loss_n, nutrient_loss_p, nutrient_loss_k,
+                        n_after_event, p_after_event, k_after_event,
+                        processed, processed_at
+                    )
+                    VALUES %s
+                    RETURNING cycle_id, event_id
+                """, event_rows,
+                    template="(%s, CURRENT_TIMESTAMP, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, TRUE, CURRENT_TIMESTAMP)",
+                    fetch=True
+                )
+                event_ids = {row['cycle_id']: row['event_id'] for row in inserted}
+                
+                execute_values(cursor, """
+                    UPDATE crop_cycles AS cc
+                    SET current_n_kg_ha = v.n,
+                        current_p_kg_ha = v.p,
+                        current_k_kg_ha = v.k,
+                        total_rainfall_loss_n = COALESCE(cc.total_rainfall_loss_n, 0) + v.loss_n,
+                        total_rainfall_loss_p = COALESCE(cc.total_rainfall_loss_p, 0) + v.loss_p,
+                        total_rainfall_loss_k = COALESCE(cc.total_rainfall_loss_k, 0) + v.loss_k,
+                        rainfall_event_count = COALESCE(cc.rainfall_event_count, 0) + 1,
+                        last_weather_check = CURRENT_TIMESTAMP
+                    FROM (VALUES %s) AS v(cycle_id, n, p, k, loss_n, loss_p, loss_k)
+                    WHERE cc.cycle_id = v.cycle_id
+                """, cycle_rows,
+                    template="(%s::int, %s::numeric, %s::numeric, %s::numeric, %s::numeric, %s::numeric, %s::numeric)"
+                )
+                
+                self._insert_measurements(cursor, measurement_rows)
+                
+                if soil_test_rows:
+                    execute_values(cursor, """
+                        INSERT INTO soil_test_recommendations (
+                            cycle_id, farmer_id, reason,
+                            current_n_kg_ha, current_p_kg_ha, current_k_kg_ha,
+                            message, status
+                        )
+                        VALUES %s
+                    """, soil_test_rows, template="(%s, %s, %s, %s, %s, %s, %s, 'pending')")
+                
+                # Dry cycles from this batch are stamped in the same commit
+                self.flush_heartbeats(cursor)
+            
+            for (cycle, weather_data), rainfall_mm, npk_loss, npk_new, status in zip(
+                rained, rainfall, losses, remaining, statuses
+            ):
+                result = self._rainfall_result(
+                    rainfall_mm, event_ids.get(cycle.cycle_id), npk_loss, npk_new, status
+                )
+                result.update(self._weather_details(
+                    weather_data, rainfall_mm, float(cycle.latitude), float(cycle.longitude)
+                ))
+                results[cycle.cycle_id] = result
+        
+        try:
+            self.flush_heartbeats()
+        except Exception as e:
+            print(f"Warning: could not update last_weather_check: {e}")
+        
+        return results
+    
     def process_rainfall_event(
         self,
         cycle_id: int,
@@ -271,6 +580,7 @@ class RINDMCycleManager:
         current_k: float,
         soil_type: str,
         duration_hours: float = 2.0,
+        farmer_id: int = None,
         weather_data: Dict = None,
         latitude: float = None,
         longitude: float = None
@@ -284,6 +594,7 @@ class RINDMCycleManager:
             current_n, current_p, current_k: Current nutrient levels
             soil_type: Soil type
             duration_hours: Estimated duration (default 2 hours)
+            farmer_id: Owner of the cycle (read back from the cycle update if omitted)
             weather_data: Weather data from API
             latitude: Field latitude
             longitude: Field longitude
@@ -310,26 +621,9 @@ class RINDMCycleManager:
         status = check_nutrient_status(new_n, new_p, new_k)
         
         # Update database
-        with self.db.get_connection() as (conn, cursor):
+        with self.db.get_connection(cursor_factory=NamedTupleCursor) as (conn, cursor):
             # Record rainfall event
-            cursor.execute("""
-                INSERT INTO rainfall_events (
-                    cycle_id, event_start, rainfall_mm, duration_hours,
-                    intensity_mm_per_hour,
-                    n_before_event, p_before_event, k_before_event,
-                    nutrient_loss_n, nutrient_loss_p, nutrient_loss_k,
-                    n_after_event, p_after_event, k_after_event,
-                    processed, processed_at
-                )
-                VALUES (
-                    %s, CURRENT_TIMESTAMP, %s, %s, %s,
-                    %s, %s, %s,
-                    %s, %s, %s,
-                    %s, %s, %s,
-                    TRUE, CURRENT_TIMESTAMP
-                )
-                RETURNING event_id
-            """, (
+            self.db.execute_prepared(cursor, 'rindm_insert_rainfall', _SQL_INSERT_RAINFALL_EVENT, (
                 cycle_id, rainfall_mm, duration_hours,
                 rainfall_mm / duration_hours,
                 current_n, current_p, current_k,
@@ -337,86 +631,79 @@ class RINDMCycleManager:
                 new_n, new_p, new_k
             ))
             
-            event_id = cursor.fetchone()['event_id']
+            event_id = cursor.fetchone().event_id
             
             # Update cycle with new nutrient levels
-            cursor.execute("""
-                UPDATE crop_cycles
-                SET current_n_kg_ha = %s,
-                    current_p_kg_ha = %s,
-                    current_k_kg_ha = %s,
-                    total_rainfall_loss_n = COALESCE(total_rainfall_loss_n, 0) + %s,
-                    total_rainfall_loss_p = COALESCE(total_rainfall_loss_p, 0) + %s,
-                    total_rainfall_loss_k = COALESCE(total_rainfall_loss_k, 0) + %s,
-                    rainfall_event_count = COALESCE(rainfall_event_count, 0) + 1,
-                    last_weather_check = CURRENT_TIMESTAMP
-                WHERE cycle_id = %s
-            """, (
+            self.db.execute_prepared(cursor, 'rindm_update_cycle_rainfall', _SQL_UPDATE_CYCLE_RAINFALL, (
                 new_n, new_p, new_k,
                 loss_result['N_loss'], loss_result['P_loss'], loss_result['K_loss'],
                 cycle_id
             ))
             
+            if farmer_id is None:
+                farmer_id = cursor.fetchone().farmer_id
+            
             # Record measurement
-            cursor.execute("""
-                INSERT INTO nutrient_measurements (
-                    cycle_id, measurement_type, n_kg_ha, p_kg_ha, k_kg_ha,
-                    below_threshold, notes
-                )
-                VALUES (
-                    %s, 'rainfall_update', %s, %s, %s,
-                    %s,
-                    %s
-                )
-            """, (
-                cycle_id, new_n, new_p, new_k,
+            self._record_measurement(
+                cursor, cycle_id, 'rainfall_update', new_n, new_p, new_k,
                 status['needs_soil_test'],
-                f'Rainfall: {rainfall_mm}mm, Losses: N={loss_result["N_loss"]}, P={loss_result["P_loss"]}, K={loss_result["K_loss"]}'
-            ))
+                details={
+                    'rainfall_mm': float(rainfall_mm),
+                    'losses': {
+                        'N': float(loss_result['N_loss']),
+                        'P': float(loss_result['P_loss']),
+                        'K': float(loss_result['K_loss'])
+                    }
+                }
+            )
             
             # Create warning if threshold reached
             if status['needs_soil_test']:
-                cursor.execute("""
-                    SELECT farmer_id FROM crop_cycles WHERE cycle_id = %s
-                """, (cycle_id,))
-                farmer_id = cursor.fetchone()['farmer_id']
-                
-                cursor.execute("""
-                    INSERT INTO soil_test_recommendations (
-                        cycle_id, farmer_id, reason,
-                        current_n_kg_ha, current_p_kg_ha, current_k_kg_ha,
-                        message, status
-                    )
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, 'pending')
-                """, (
+                self.db.execute_prepared(cursor, 'rindm_insert_soil_test', _SQL_INSERT_SOIL_TEST, (
                     cycle_id, farmer_id, 'low_nutrients',
                     new_n, new_p, new_k,
                     status['soil_test_message']
                 ))
         
-        result = {
+        result = self._rainfall_result(
+            rainfall_mm, event_id,
+            (loss_result['N_loss'], loss_result['P_loss'], loss_result['K_loss']),
+            (new_n, new_p, new_k),
+            status
+        )
+        
+        # Add weather and location info if available
+        if weather_data:
+            result.update(self._weather_details(weather_data, rainfall_mm, latitude, longitude))
+        
+        return result
+    
+    @staticmethod
+    def _rainfall_result(
+        rainfall_mm: float,
+        event_id: int,
+        losses: Tuple[float, float, float],
+        remaining: Tuple[float, float, float],
+        status: Dict
+    ) -> Dict:
+        """Build the response for a processed rainfall event."""
+        return {
             'success': True,
             'rainfall_detected': True,
             'rainfall_mm': rainfall_mm,
             'event_id': event_id,
-            'nutrient_loss': {
-                'N': loss_result['N_loss'],
-                'P': loss_result['P_loss'],
-                'K': loss_result['K_loss']
-            },
-            'updated_nutrients': {
-                'N': new_n,
-                'P': new_p,
-                'K': new_k
-            },
+            'nutrient_loss': dict(zip('NPK', losses)),
+            'updated_nutrients': dict(zip('NPK', remaining)),
             'status': status,
             'warning': status['needs_soil_test'],
             'message': status['soil_test_message'] if status['needs_soil_test'] else 'Nutrients updated'
         }
-        
-        # Add weather and location info if available
-        if weather_data:
-            result['weather'] = {
+    
+    @staticmethod
+    def _weather_details(weather_data: Dict, rainfall_mm: float, latitude: float, longitude: float) -> Dict:
+        """Weather and location blocks included in rainfall check responses."""
+        return {
+            'weather': {
                 'temperature': weather_data.get('temperature'),
                 'humidity': weather_data.get('humidity'),
                 'rainfall': rainfall_mm,
@@ -424,15 +711,14 @@ class RINDMCycleManager:
                 'pressure': weather_data.get('pressure'),
                 'description': weather_data.get('description'),
                 'timestamp': weather_data.get('timestamp')
-            }
-            result['location'] = {
+            },
+            'location': {
                 'name': weather_data.get('location_name', 'Unknown'),
                 'country': weather_data.get('country', ''),
                 'latitude': latitude,
                 'longitude': longitude
             }
-        
-        return result
+        }
     
     def complete_cycle(self, cycle_id: int) -> Dict:
         """
@@ -444,53 +730,55 @@ class RINDMCycleManager:
         Returns:
             Dictionary with final nutrients and next crop recommendations
         """
-        # Get cycle info
         with self.db.get_connection() as (conn, cursor):
+            # Close the cycle; final nutrients are current levels minus crop uptake
+            # (uptake and loss totals may be NULL, which counts as zero)
             cursor.execute("""
-                SELECT * FROM crop_cycles WHERE cycle_id = %s
+                UPDATE crop_cycles
+                SET status = 'completed',
+                    actual_end_date = CURRENT_DATE,
+                    final_n_kg_ha = GREATEST(0, current_n_kg_ha - COALESCE(total_crop_uptake_n, 0)),
+                    final_p_kg_ha = GREATEST(0, current_p_kg_ha - COALESCE(total_crop_uptake_p, 0)),
+                    final_k_kg_ha = GREATEST(0, current_k_kg_ha - COALESCE(total_crop_uptake_k, 0))
+                WHERE cycle_id = %s
+                RETURNING
+                    final_n_kg_ha, final_p_kg_ha, final_k_kg_ha,
+                    initial_n_kg_ha, initial_p_kg_ha, initial_k_kg_ha,
+                    COALESCE(total_crop_uptake_n, 0) AS total_crop_uptake_n,
+                    COALESCE(total_crop_uptake_p, 0) AS total_crop_uptake_p,
+                    COALESCE(total_crop_uptake_k, 0) AS total_crop_uptake_k,
+                    COALESCE(total_rainfall_loss_n, 0) AS total_rainfall_loss_n,
+                    COALESCE(total_rainfall_loss_p, 0) AS total_rainfall_loss_p,
+                    COALESCE(total_rainfall_loss_k, 0) AS total_rainfall_loss_k
             """, (cycle_id,))
             
             cycle = cursor.fetchone()
             if not cycle:
                 return {'success': False, 'error': 'Cycle not found'}
             
-            cycle = dict(cycle)
-        
-        # Calculate final nutrients after crop uptake
-        final_n = max(0, cycle['current_n_kg_ha'] - cycle['total_crop_uptake_n'])
-        final_p = max(0, cycle['current_p_kg_ha'] - cycle['total_crop_uptake_p'])
-        final_k = max(0, cycle['current_k_kg_ha'] - cycle['total_crop_uptake_k'])
-        
-        # Check if below threshold
-        below_threshold = (
-            final_n < self.CRITICAL_THRESHOLDS['N'] or
-            final_p < self.CRITICAL_THRESHOLDS['P'] or
-            final_k < self.CRITICAL_THRESHOLDS['K']
-        )
-        
-        # Update cycle
-        with self.db.get_connection() as (conn, cursor):
-            cursor.execute("""
-                UPDATE crop_cycles
-                SET status = 'completed',
-                    actual_end_date = CURRENT_DATE,
-                    final_n_kg_ha = %s,
-                    final_p_kg_ha = %s,
-                    final_k_kg_ha = %s
-                WHERE cycle_id = %s
-            """, (final_n, final_p, final_k, cycle_id))
+            final_n = cycle['final_n_kg_ha']
+            final_p = cycle['final_p_kg_ha']
+            final_k = cycle['final_k_kg_ha']
+            
+            # Check if below threshold
+            below_threshold = (
+                final_n < self.CRITICAL_THRESHOLDS['N'] or
+                final_p < self.CRITICAL_THRESHOLDS['P'] or
+                final_k < self.CRITICAL_THRESHOLDS['K']
+            )
             
             # Record final measurement
-            cursor.execute("""
-                INSERT INTO nutrient_measurements (
-                    cycle_id, measurement_type, n_kg_ha, p_kg_ha, k_kg_ha,
-                    below_threshold, notes
-                )
-                VALUES (%s, 'cycle_end', %s, %s, %s, %s, %s)
-            """, (
-                cycle_id, final_n, final_p, final_k, below_threshold,
-                f'Cycle completed. Crop uptake: N={cycle["total_crop_uptake_n"]}, P={cycle["total_crop_uptake_p"]}, K={cycle["total_crop_uptake_k"]}'
-            ))
+            self._record_measurement(
+                cursor, cycle_id, 'cycle_end', final_n, final_p, final_k, below_threshold,
+                'Cycle completed',
+                details={
+                    'crop_uptake': {
+                        'N': float(cycle['total_crop_uptake_n']),
+                        'P': float(cycle['total_crop_uptake_p']),
+                        'K': float(cycle['total_crop_uptake_k'])
+                    }
+                }
+            )
         
         return {
             'success': True,
@@ -528,14 +816,33 @@ class RINDMCycleManager:
         with self.db.get_connection() as (conn, cursor):
             cursor.execute("""
                 SELECT 
-                    cc.*,
-                    cnr.cycle_days,
+                    cc.status,
+                    cc.crop_name,
+                    cc.cycle_number,
+                    cc.soil_type,
+                    cc.start_date,
+                    cc.expected_end_date,
+                    cc.last_weather_check,
+                    -- Numerics cast in SQL so the driver returns floats, not Decimals
+                    cc.soil_ph::float8 AS soil_ph,
+                    cc.current_n_kg_ha::float8 AS current_n_kg_ha,
+                    cc.current_p_kg_ha::float8 AS current_p_kg_ha,
+                    cc.current_k_kg_ha::float8 AS current_k_kg_ha,
+                    cc.initial_n_kg_ha::float8 AS initial_n_kg_ha,
+                    cc.initial_p_kg_ha::float8 AS initial_p_kg_ha,
+                    cc.initial_k_kg_ha::float8 AS initial_k_kg_ha,
+                    cc.total_crop_uptake_n::float8 AS total_crop_uptake_n,
+                    cc.total_crop_uptake_p::float8 AS total_crop_uptake_p,
+                    cc.total_crop_uptake_k::float8 AS total_crop_uptake_k,
+                    cc.cycle_days,
                     (CURRENT_DATE - cc.start_date) as days_elapsed,
                     (cc.expected_end_date - CURRENT_DATE) as days_remaining,
-                    f.latitude,
-                    f.longitude
+                    COALESCE(ROUND(
+                        (CURRENT_DATE - cc.start_date)::numeric / NULLIF(cc.cycle_days, 0) * 100, 1
+                    ), 0)::float8 AS percent_complete,
+                    f.latitude::float8 AS latitude,
+                    f.longitude::float8 AS longitude
                 FROM crop_cycles cc
-                JOIN crop_nutrient_requirements cnr ON cc.crop_name = cnr.crop_name
                 LEFT JOIN fields f ON cc.field_id = f.field_id
                 WHERE cc.cycle_id = %s
             """, (cycle_id,))
@@ -555,6 +862,7 @@ class RINDMCycleManager:
                     k_kg_ha,
                     below_threshold,
                     notes,
+                    details,
                     measurement_date AS recorded_at
                 FROM nutrient_measurements
                 WHERE cycle_id = %s
@@ -591,37 +899,37 @@ class RINDMCycleManager:
                 'crop': cycle['crop_name'],
                 'cycle_number': cycle['cycle_number'],
                 'soil_type': cycle['soil_type'],
-                'ph': float(cycle['soil_ph']) if cycle['soil_ph'] else 7.0,
+                'ph': cycle['soil_ph'] or 7.0,
                 'start_date': str(cycle['start_date']),
                 'expected_end_date': str(cycle['expected_end_date']),
                 'progress': {
                     'days_elapsed': int(cycle['days_elapsed']) if cycle['days_elapsed'] else 0,
                     'days_remaining': int(cycle['days_remaining']) if cycle['days_remaining'] else 0,
                     'total_days': cycle['cycle_days'],
-                    'percent_complete': round((int(cycle['days_elapsed']) / cycle['cycle_days']) * 100, 1) if cycle['days_elapsed'] else 0
+                    'percent_complete': cycle['percent_complete']
                 },
                 'current_nutrients': {
-                    'N': float(cycle['current_n_kg_ha']),
-                    'P': float(cycle['current_p_kg_ha']),
-                    'K': float(cycle['current_k_kg_ha'])
+                    'N': cycle['current_n_kg_ha'],
+                    'P': cycle['current_p_kg_ha'],
+                    'K': cycle['current_k_kg_ha']
                 },
                 'initial_nutrients': {
-                    'N': float(cycle['initial_n_kg_ha']),
-                    'P': float(cycle['initial_p_kg_ha']),
-                    'K': float(cycle['initial_k_kg_ha'])
+                    'N': cycle['initial_n_kg_ha'],
+                    'P': cycle['initial_p_kg_ha'],
+                    'K': cycle['initial_k_kg_ha']
                 },
                 'crop_requirements': {
-                    'N': float(cycle['total_crop_uptake_n']),
-                    'P': float(cycle['total_crop_uptake_p']),
-                    'K': float(cycle['total_crop_uptake_k'])
+                    'N': cycle['total_crop_uptake_n'],
+                    'P': cycle['total_crop_uptake_p'],
+                    'K': cycle['total_crop_uptake_k']
                 },
                 'nutrient_status': status,
                 'rainfall_events': rainfall_events,
                 'rainfall_event_count': len(rainfall_events),
                 'measurements': measurements,
                 'last_weather_check': str(cycle['last_weather_check']) if cycle['last_weather_check'] else None,
-                'latitude': float(cycle['latitude']) if cycle.get('latitude') else None,
-                'longitude': float(cycle['longitude']) if cycle.get('longitude') else None
+                'latitude': cycle['latitude'] or None,
+                'longitude': cycle['longitude'] or None
             }
 
 
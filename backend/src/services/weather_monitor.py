@@ -15,19 +15,51 @@ Usage:
     monitor.check_all_active_cycles()
 """
 
+import os
+import logging
+from logging.handlers import MemoryHandler
 import threading
 import time
 import schedule
 from datetime import datetime
-from typing import List, Dict
+from typing import List, Dict, Optional
 import sys
 from pathlib import Path
+from psycopg2.extras import NamedTupleCursor
 
 # Add backend to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from database.db_utils import DatabaseManager
-from src.services.rindm_cycle_manager import RINDMCycleManager
+from database.db_utils import DatabaseManager, get_shared_manager
+from src.services.rindm_cycle_manager import RINDMCycleManager, ActiveCycle
+
+# Active cycles are checked this many at a time (one batch call each)
+CHECK_BATCH_SIZE = 1000
+
+# Without an API key, mature cycles are still completed this often
+COMPLETION_CHECK_HOURS = 6
+
+# Per-cycle lines are buffered and written out once per check (errors flush immediately)
+log = logging.getLogger('weather_monitor')
+_log_buffer = None
+
+
+def _configure_logging():
+    """Send monitor log lines to stdout through a memory buffer (idempotent)."""
+    global _log_buffer
+    if _log_buffer is None:
+        stream = logging.StreamHandler(sys.stdout)
+        stream.setFormatter(logging.Formatter('%(message)s'))
+        _log_buffer = MemoryHandler(capacity=1024, flushLevel=logging.ERROR, target=stream)
+        log.addHandler(_log_buffer)
+        log.setLevel(logging.INFO)
+        log.propagate = False
+
+
+def _flush_log():
+    """Write out buffered log lines at the end of a check."""
+    if _log_buffer is not None:
+        _log_buffer.flush()
 
 
 class WeatherMonitor:
@@ -35,134 +67,217 @@ class WeatherMonitor:
     Background service to monitor weather for active cycles.
     """
     
-    def __init__(self, check_interval_minutes: int = 60):
+    def __init__(self, check_interval_minutes: int = 60, db_manager: DatabaseManager = None):
         """
         Initialize weather monitor.
         
         Args:
             check_interval_minutes: How often to check weather (default: 60 minutes)
+            db_manager: Database manager (default: the process-wide shared manager)
         """
-        self.db = DatabaseManager()
+        # The pool is shared with the API, so the monitor never closes it
+        self.db = db_manager or get_shared_manager()
+        _configure_logging()
         self.cycle_manager = RINDMCycleManager(self.db)
         self.check_interval = check_interval_minutes
-        self.is_running = False
+        self._stop = threading.Event()
         self.thread = None
+        
+        # Concurrent weather API calls per batch
+        self.max_workers = int(os.getenv('WEATHER_CHECK_WORKERS', '16'))
+        
+        # Without an API key every reading would be mock data, so skip weather
+        # checks and only complete cycles that reach their end date
+        self.disabled = not self.cycle_manager.weather.api_key
     
-    def get_active_cycles(self) -> List[Dict]:
+    def has_active_cycles(self) -> bool:
         """
-        Get all active cycles that need weather monitoring.
+        Cheap check for whether any cycle is currently active.
         
         Returns:
-            List of active cycle dictionaries
+            True if at least one cycle has status 'active'
         """
         with self.db.get_connection() as (conn, cursor):
+            cursor.execute("SELECT 1 FROM crop_cycles WHERE status = 'active' LIMIT 1")
+            return cursor.fetchone() is not None
+    
+    def _run_if_active(self, check):
+        """Run a scheduled check only when there are active cycles to look at."""
+        try:
+            if not self.has_active_cycles():
+                return
+        except Exception as e:
+            log.error(f"  ✗ Error counting active cycles: {e}")
+            return
+        
+        check()
+    
+    def get_active_cycles(
+        self,
+        recheck_after_minutes: Optional[int] = None
+    ) -> List[ActiveCycle]:
+        """
+        Get all active cycles that need weather monitoring.
+        
+        Cycles whose weather was checked within the last `recheck_after_minutes`
+        (e.g. just before a restart) are skipped, unless they are due to be
+        completed. The rows are fetched in full and the connection is returned
+        to the pool before any weather API calls are made.
+        
+        Args:
+            recheck_after_minutes: Minimum minutes since the last check
+                (default: check interval minus 5 minutes)
+            
+        Returns:
+            ActiveCycle records, least recently checked first
+        """
+        if recheck_after_minutes is None:
+            recheck_after_minutes = max(self.check_interval - 5, 0)
+        
+        # Plain tuple rows; columns are in ActiveCycle field order
+        with self.db.get_connection(cursor_factory=None) as (conn, cursor):
             cursor.execute("""
                 SELECT 
                     cc.cycle_id,
                     cc.farmer_id,
                     cc.crop_name,
+                    cc.soil_type,
                     cc.start_date,
                     cc.expected_end_date,
-                    cc.current_n_kg_ha,
-                    cc.current_p_kg_ha,
-                    cc.current_k_kg_ha,
+                    cc.current_n_kg_ha::float8,
+                    cc.current_p_kg_ha::float8,
+                    cc.current_k_kg_ha::float8,
                     cc.last_weather_check,
-                    f.latitude,
-                    f.longitude
+                    f.latitude::float8,
+                    f.longitude::float8,
+                    (cc.expected_end_date <= CURRENT_DATE) AS should_complete
                 FROM crop_cycles cc
                 JOIN fields f ON cc.field_id = f.field_id
                 WHERE cc.status = 'active'
+                  AND (cc.last_weather_check IS NULL
+                       OR cc.last_weather_check < CURRENT_TIMESTAMP - make_interval(mins => %s)
+                       OR cc.expected_end_date <= CURRENT_DATE)
                 ORDER BY cc.last_weather_check ASC
-            """)
+            """, (recheck_after_minutes,))
             
-            return [dict(row) for row in cursor.fetchall()]
+            return [ActiveCycle(*row) for row in cursor.fetchall()]
     
     def check_all_active_cycles(self) -> Dict:
         """
         Check weather for all active cycles and process any rainfall.
         
+        Cycles are checked in chunks of CHECK_BATCH_SIZE and each chunk is
+        handled by one batch call (one weather fetch per location and one
+        set of bulk writes). Cycles that have reached their expected end
+        date in the same listing are completed afterwards, so no separate
+        query is needed to find them.
+        
         Returns:
             Summary of checks performed
         """
         start_time = datetime.now()
-        active_cycles = self.get_active_cycles()
-        
-        if not active_cycles:
-            return {
-                'timestamp': str(start_time),
-                'cycles_checked': 0,
-                'rainfall_detected': 0,
-                'warnings_generated': 0,
-                'message': 'No active cycles to monitor'
-            }
-        
-        print(f"\n[{start_time.strftime('%Y-%m-%d %H:%M:%S')}] Checking {len(active_cycles)} active cycles...")
         
+        cycles_checked = 0
         rainfall_count = 0
         warning_count = 0
         results = []
+        cycles_to_complete = []
         
-        for cycle in active_cycles:
+        active_cycles = self.get_active_cycles()
+        for start in range(0, len(active_cycles), CHECK_BATCH_SIZE):
+            batch = active_cycles[start:start + CHECK_BATCH_SIZE]
+            
+            if not cycles_checked:
+                log.info(f"\n[{start_time.strftime('%Y-%m-%d %H:%M:%S')}] Checking active cycles...")
+            cycles_checked += len(batch)
+            cycles_to_complete.extend(cycle for cycle in batch if cycle.should_complete)
+            
             try:
-                # Check and process rainfall for this cycle
-                result = self.cycle_manager.check_and_process_rainfall(cycle['cycle_id'])
+                batch_results = self.cycle_manager.batch_check_and_process_rainfall(
+                    batch, max_workers=self.max_workers
+                )
+            except Exception as e:
+                log.error(f"  ✗ Error checking active cycles: {e}")
+                batch_results = {cycle.cycle_id: {'success': False, 'error': str(e)} for cycle in batch}
+            
+            for cycle in batch:
+                result = batch_results.get(cycle.cycle_id, {})
+                
+                if not result.get('success', False):
+                    log.error(f"  ✗ Error checking cycle {cycle.cycle_id}: {result.get('error')}")
+                    results.append({
+                        'cycle_id': cycle.cycle_id,
+                        'error': result.get('error')
+                    })
+                    continue
                 
                 if result.get('rainfall_detected'):
                     rainfall_count += 1
-                    print(f"  ✓ Cycle {cycle['cycle_id']} ({cycle['crop_name']}): "
+                    log.info(f"  ✓ Cycle {cycle.cycle_id} ({cycle.crop_name}): "
                           f"Rainfall {result['rainfall_mm']}mm detected")
                     
                     if result.get('warning'):
                         warning_count += 1
-                        print(f"    ⚠️  Warning: {result['message']}")
+                        log.warning(f"    ⚠️  Warning: {result['message']}")
                 
                 results.append({
-                    'cycle_id': cycle['cycle_id'],
-                    'crop': cycle['crop_name'],
+                    'cycle_id': cycle.cycle_id,
+                    'crop': cycle.crop_name,
                     'rainfall_detected': result.get('rainfall_detected', False),
                     'warning': result.get('warning', False)
                 })
-                
-            except Exception as e:
-                print(f"  ✗ Error checking cycle {cycle['cycle_id']}: {e}")
-                results.append({
-                    'cycle_id': cycle['cycle_id'],
-                    'error': str(e)
-                })
+        
+        if not cycles_checked:
+            return {
+                'timestamp': str(start_time),
+                'cycles_checked': 0,
+                'rainfall_detected': 0,
+                'warnings_generated': 0,
+                'message': 'No active cycles to monitor'
+            }
+        
+        completion = self.check_and_complete_cycles(cycles_to_complete)
         
         duration = (datetime.now() - start_time).total_seconds()
         
         summary = {
             'timestamp': str(start_time),
             'duration_seconds': round(duration, 2),
-            'cycles_checked': len(active_cycles),
+            'cycles_checked': cycles_checked,
             'rainfall_detected': rainfall_count,
             'warnings_generated': warning_count,
+            'cycles_completed': completion['cycles_completed'],
             'results': results,
-            'message': f'Checked {len(active_cycles)} cycles, {rainfall_count} rainfall events, {warning_count} warnings'
+            'message': f'Checked {cycles_checked} cycles, {rainfall_count} rainfall events, {warning_count} warnings'
         }
         
-        print(f"  Completed in {duration:.2f}s\n")
+        log.info(f"  Completed {cycles_checked} cycles in {duration:.2f}s\n")
+        _flush_log()
         
         return summary
     
-    def check_and_complete_cycles(self) -> Dict:
+    def check_and_complete_cycles(self, cycles_to_complete: Optional[List[ActiveCycle]] = None) -> Dict:
         """
         Check if any active cycles have reached their end date and complete them.
         
+        Args:
+            cycles_to_complete: Mature cycles already found by the caller;
+                queried from the database if omitted
+        
         Returns:
             Summary of completed cycles
         """
-        with self.db.get_connection() as (conn, cursor):
-            # Find cycles that have reached end date
-            cursor.execute("""
-                SELECT cycle_id, crop_name, farmer_id, expected_end_date
-                FROM crop_cycles
-                WHERE status = 'active' 
-                  AND expected_end_date <= CURRENT_DATE
-            """)
-            
-            cycles_to_complete = [dict(row) for row in cursor.fetchall()]
+        if cycles_to_complete is None:
+            with self.db.get_connection(cursor_factory=NamedTupleCursor) as (conn, cursor):
+                # Find cycles that have reached end date
+                cursor.execute("""
+                    SELECT cycle_id, crop_name, farmer_id, expected_end_date
+                    FROM crop_cycles
+                    WHERE status = 'active' 
+                      AND expected_end_date <= CURRENT_DATE
+                """)
+                
+                cycles_to_complete = cursor.fetchall()
         
         if not cycles_to_complete:
             return {
@@ -170,28 +285,30 @@ class WeatherMonitor:
                 'message': 'No cycles ready to complete'
             }
         
-        print(f"\n[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Completing {len(cycles_to_complete)} mature cycles...")
+        log.info(f"\n[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Completing {len(cycles_to_complete)} mature cycles...")
         
         completed = []
         for cycle in cycles_to_complete:
             try:
-                result = self.cycle_manager.complete_cycle(cycle['cycle_id'])
+                result = self.cycle_manager.complete_cycle(cycle.cycle_id)
                 
                 if result['success']:
-                    print(f"  ✓ Completed cycle {cycle['cycle_id']} ({cycle['crop_name']})")
-                    print(f"    Final nutrients: N={result['final_nutrients']['N']:.1f}, "
+                    log.info(f"  ✓ Completed cycle {cycle.cycle_id} ({cycle.crop_name})")
+                    log.info(f"    Final nutrients: N={result['final_nutrients']['N']:.1f}, "
                           f"P={result['final_nutrients']['P']:.1f}, "
                           f"K={result['final_nutrients']['K']:.1f}")
                     
                     if result['below_threshold']:
-                        print(f"    ⚠️  Nutrients below threshold - stopping cycles")
+                        log.warning(f"    ⚠️  Nutrients below threshold - stopping cycles")
                     else:
-                        print(f"    ✓ Can continue to next cycle")
+                        log.info(f"    ✓ Can continue to next cycle")
                     
                     completed.append(result)
                 
             except Exception as e:
-                print(f"  ✗ Error completing cycle {cycle['cycle_id']}: {e}")
+                log.error(f"  ✗ Error completing cycle {cycle.cycle_id}: {e}")
+        
+        _flush_log()
         
         return {
             'cycles_completed': len(completed),
@@ -204,25 +321,38 @@ class WeatherMonitor:
         Run scheduled weather checks in a loop.
         This method runs in a background thread.
         """
+        if self.disabled:
+            check = self.check_and_complete_cycles
+            interval_minutes = COMPLETION_CHECK_HOURS * 60
+        else:
+            # Each weather check also completes cycles that have reached their end date
+            check = self.check_all_active_cycles
+            interval_minutes = self.check_interval
+        
         print(f"\n{'='*80}")
         print(f"Weather Monitor Started")
         print(f"{'='*80}")
-        print(f"Check interval: {self.check_interval} minutes")
-        print(f"Monitoring all active RINDM cycles...")
+        print(f"Check interval: {interval_minutes} minutes")
+        if self.disabled:
+            print(f"Completing mature RINDM cycles only (no weather checks)...")
+        else:
+            print(f"Monitoring all active RINDM cycles...")
         print(f"{'='*80}\n")
         
         # Schedule tasks
-        schedule.every(self.check_interval).minutes.do(self.check_all_active_cycles)
-        schedule.every(6).hours.do(self.check_and_complete_cycles)  # Check completion every 6 hours
+        schedule.every(interval_minutes).minutes.do(self._run_if_active, check)
         
         # Run immediately on start
-        self.check_all_active_cycles()
-        self.check_and_complete_cycles()
+        self._run_if_active(check)
         
-        # Keep running
-        while self.is_running:
+        # Sleep until the next job is due (re-checking at least every minute); stop() wakes us immediately
+        while not self._stop.is_set():
             schedule.run_pending()
-            time.sleep(60)  # Check every minute if any jobs are due
+            delay = schedule.idle_seconds()
+            if self._stop.wait(timeout=60 if delay is None else max(0, min(delay, 60))):
+                break
+        
+        self.cycle_manager.weather.close()
         
         print(f"\n{'='*80}")
         print(f"Weather Monitor Stopped")
@@ -232,11 +362,15 @@ class WeatherMonitor:
         """
         Start weather monitoring in a background thread.
         """
-        if self.is_running:
+        if self.is_active():
             print("Weather monitor is already running")
             return
         
-        self.is_running = True
+        if self.disabled:
+            print("⚠ Weather checks disabled (OPENWEATHERMAP_API_KEY is not set); "
+                  "mature cycles will still be completed")
+        
+        self._stop.clear()
         self.thread = threading.Thread(target=self.run_scheduled_checks, daemon=True)
         self.thread.start()
         
@@ -246,11 +380,11 @@ class WeatherMonitor:
         """
         Stop weather monitoring.
         """
-        if not self.is_running:
+        if not self.is_active():
             print("Weather monitor is not running")
             return
         
-        self.is_running = False
+        self._stop.set()
         if self.thread:
             self.thread.join(timeout=5)
         
@@ -258,19 +392,23 @@ class WeatherMonitor:
     
     def is_active(self) -> bool:
         """Check if monitor is running."""
-        return self.is_running
+        return self.thread is not None and self.thread.is_alive() and not self._stop.is_set()
 
 
 # Global instance
 _monitor_instance = None
 
 
-def get_monitor_instance(check_interval_minutes: int = 60) -> WeatherMonitor:
+def get_monitor_instance(
+    check_interval_minutes: int = 60,
+    db_manager: DatabaseManager = None
+) -> WeatherMonitor:
     """
     Get or create the global weather monitor instance.
     
     Args:
         check_interval_minutes: Check interval (default: 60)
+        db_manager: Database manager to share (default: the shared manager)
         
     Returns:
         WeatherMonitor instance
@@ -278,19 +416,20 @@ def get_monitor_instance(check_interval_minutes: int = 60) -> WeatherMonitor:
     global _monitor_instance
     
     if _monitor_instance is None:
-        _monitor_instance = WeatherMonitor(check_interval_minutes)
+        _monitor_instance = WeatherMonitor(check_interval_minutes, db_manager)
     
     return _monitor_instance
 
 
-def start_monitor(check_interval_minutes: int = 60):
+def start_monitor(check_interval_minutes: int = 60, db_manager: DatabaseManager = None):
     """
     Start the global weather monitor.
     
     Args:
         check_interval_minutes: Check interval (default: 60)
+        db_manager: Database manager to share (default: the shared manager)
     """
-    monitor = get_monitor_instance(check_interval_minutes)
+    monitor = get_monitor_instance(check_interval_minutes, db_manager)
     monitor.start()
     return monitor
 
@@ -323,6 +462,9 @@ if __name__ == "__main__":
         monitor = WeatherMonitor(check_interval_minutes=interval)
         monitor.start()
         
+        if not monitor.is_active():
+            sys.exit(1)
+        
         print(f"\nMonitor running... Press Ctrl+C to stop\n")
         
         # Keep main thread alive
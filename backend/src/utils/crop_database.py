@@ -5,135 +5,74 @@ Standard growing period for each crop in the recommendation system.
 Data sourced from agricultural research and FAO standards.
 """
 
-CROP_CYCLE_DURATION = {
-    # Duration in days (approximate average)
-    'rice': 120,          # 4 months
-    'maize': 100,         # 3.3 months
-    'chickpea': 100,      # 3.3 months
-    'kidneybeans': 90,    # 3 months
-    'pigeonpeas': 240,    # 8 months
-    'mothbeans': 75,      # 2.5 months
-    'mungbean': 60,       # 2 months
-    'blackgram': 90,      # 3 months
-    'lentil': 110,        # 3.7 months
-    'pomegranate': 210,   # 7 months (perennial, mature fruit)
-    'banana': 270,        # 9 months
-    'mango': 150,         # 5 months (flowering to harvest)
-    'coconut': 365,       # 12 months (annually)
-    'cotton': 180,        # 6 months
-    'coffee': 365,        # 12 months (annual cycle)
-    'jute': 120,          # 4 months
-    'apple': 150,         # 5 months (growing season)
-    'orange': 240,        # 8 months
-    'papaya': 270,        # 9 months
-    'watermelon': 80,     # 2.7 months
-    'grapes': 150,        # 5 months
-    'muskmelon': 90,      # 3 months
+# Per-crop record: (duration in days, primary planting season,
+#                   annual water requirement in mm, optimal temperature range in Celsius (min, max))
+CROP_DB = {
+    'rice':        (120, 'Monsoon (Jun-Sep)',              1000, (20, 30)),  # 4 months
+    'maize':       (100, 'Summer/Monsoon (Mar-Jul)',        400, (21, 27)),  # 3.3 months
+    'chickpea':    (100, 'Winter (Oct-Jan)',                250, (15, 25)),  # 3.3 months
+    'kidneybeans': (90,  'Summer (Mar-Jun)',                300, (18, 28)),  # 3 months
+    'pigeonpeas':  (240, 'Monsoon (Jun-Sep)',               600, (20, 30)),  # 8 months
+    'mothbeans':   (75,  'Summer (Mar-Jun)',                200, (20, 30)),  # 2.5 months
+    'mungbean':    (60,  'Summer (Mar-Jun)',                250, (25, 30)),  # 2 months
+    'blackgram':   (90,  'Summer/Monsoon (Mar-Sep)',        300, (20, 30)),  # 3 months
+    'lentil':      (110, 'Winter (Oct-Jan)',                200, (15, 25)),  # 3.7 months
+    'pomegranate': (210, 'Summer (Mar-Jun)',                600, (20, 30)),  # 7 months (perennial, mature fruit)
+    'banana':      (270, 'Year-round (Monsoon preferred)', 1500, (18, 28)),  # 9 months
+    'mango':       (150, 'Spring/Early Summer (Feb-Jun)',   600, (24, 30)),  # 5 months (flowering to harvest)
+    'coconut':     (365, 'Year-round (Monsoon best)',      1500, (24, 32)),  # 12 months (annually)
+    'cotton':      (180, 'Summer (May-Sep)',                600, (21, 30)),  # 6 months
+    'coffee':      (365, 'Monsoon (Jun-Oct)',              1500, (15, 24)),  # 12 months (annual cycle)
+    'jute':        (120, 'Summer (Mar-Jul)',               2000, (24, 30)),  # 4 months
+    'apple':       (150, 'Spring/Summer (Mar-Aug)',         600, (7, 24)),   # 5 months (growing season)
+    'orange':      (240, 'Winter/Spring (Oct-Mar)',        1000, (13, 29)),  # 8 months
+    'papaya':      (270, 'Year-round (Summer best)',       1000, (21, 32)),  # 9 months
+    'watermelon':  (80,  'Summer (Feb-May)',                400, (21, 32)),  # 2.7 months
+    'grapes':      (150, 'Spring/Summer (Mar-Aug)',         500, (12, 28)),  # 5 months
+    'muskmelon':   (90,  'Summer (Feb-May)',                400, (21, 30)),  # 3 months
 }
 
-CROP_SEASON = {
-    # Primary season for planting
-    'rice': 'Monsoon (Jun-Sep)',
-    'maize': 'Summer/Monsoon (Mar-Jul)',
-    'chickpea': 'Winter (Oct-Jan)',
-    'kidneybeans': 'Summer (Mar-Jun)',
-    'pigeonpeas': 'Monsoon (Jun-Sep)',
-    'mothbeans': 'Summer (Mar-Jun)',
-    'mungbean': 'Summer (Mar-Jun)',
-    'blackgram': 'Summer/Monsoon (Mar-Sep)',
-    'lentil': 'Winter (Oct-Jan)',
-    'pomegranate': 'Summer (Mar-Jun)',
-    'banana': 'Year-round (Monsoon preferred)',
-    'mango': 'Spring/Early Summer (Feb-Jun)',
-    'coconut': 'Year-round (Monsoon best)',
-    'cotton': 'Summer (May-Sep)',
-    'coffee': 'Monsoon (Jun-Oct)',
-    'jute': 'Summer (Mar-Jul)',
-    'apple': 'Spring/Summer (Mar-Aug)',
-    'orange': 'Winter/Spring (Oct-Mar)',
-    'papaya': 'Year-round (Summer best)',
-    'watermelon': 'Summer (Feb-May)',
-    'grapes': 'Spring/Summer (Mar-Aug)',
-    'muskmelon': 'Summer (Feb-May)',
-}
+# Used for crops missing from CROP_DB
+_DEFAULT = (90, 'Year-round', 500, (15, 30))
 
-CROP_WATER_REQUIREMENT = {
-    # Annual water requirement in mm
-    'rice': 1000,
-    'maize': 400,
-    'chickpea': 250,
-    'kidneybeans': 300,
-    'pigeonpeas': 600,
-    'mothbeans': 200,
-    'mungbean': 250,
-    'blackgram': 300,
-    'lentil': 200,
-    'pomegranate': 600,
-    'banana': 1500,
-    'mango': 600,
-    'coconut': 1500,
-    'cotton': 600,
-    'coffee': 1500,
-    'jute': 2000,
-    'apple': 600,
-    'orange': 1000,
-    'papaya': 1000,
-    'watermelon': 400,
-    'grapes': 500,
-    'muskmelon': 400,
-}
+# Single-attribute views of CROP_DB
+CROP_CYCLE_DURATION = {name: rec[0] for name, rec in CROP_DB.items()}
+CROP_SEASON = {name: rec[1] for name, rec in CROP_DB.items()}
+CROP_WATER_REQUIREMENT = {name: rec[2] for name, rec in CROP_DB.items()}
+CROP_OPTIMAL_TEMP = {name: rec[3] for name, rec in CROP_DB.items()}
 
-CROP_OPTIMAL_TEMP = {
-    # Optimal temperature range in Celsius (min, max)
-    'rice': (20, 30),
-    'maize': (21, 27),
-    'chickpea': (15, 25),
-    'kidneybeans': (18, 28),
-    'pigeonpeas': (20, 30),
-    'mothbeans': (20, 30),
-    'mungbean': (25, 30),
-    'blackgram': (20, 30),
-    'lentil': (15, 25),
-    'pomegranate': (20, 30),
-    'banana': (18, 28),
-    'mango': (24, 30),
-    'coconut': (24, 32),
-    'cotton': (21, 30),
-    'coffee': (15, 24),
-    'jute': (24, 30),
-    'apple': (7, 24),
-    'orange': (13, 29),
-    'papaya': (21, 32),
-    'watermelon': (21, 32),
-    'grapes': (12, 28),
-    'muskmelon': (21, 30),
-}
+def _crop_record(crop_name):
+    """Look up a crop's record, lowercasing the name only if it isn't already a key."""
+    record = CROP_DB.get(crop_name)
+    if record is None:
+        record = CROP_DB.get(crop_name.lower(), _DEFAULT)
+    return record
 
 def get_crop_cycle(crop_name):
     """Get crop cycle duration in days."""
-    return CROP_CYCLE_DURATION.get(crop_name.lower(), 90)  # Default 90 days
+    return _crop_record(crop_name)[0]  # Default 90 days
 
 def get_crop_season(crop_name):
     """Get primary planting season."""
-    return CROP_SEASON.get(crop_name.lower(), 'Year-round')
+    return _crop_record(crop_name)[1]
 
 def get_water_requirement(crop_name):
     """Get annual water requirement in mm."""
-    return CROP_WATER_REQUIREMENT.get(crop_name.lower(), 500)
+    return _crop_record(crop_name)[2]
 
 def get_optimal_temp_range(crop_name):
     """Get optimal temperature range (min, max)."""
-    return CROP_OPTIMAL_TEMP.get(crop_name.lower(), (15, 30))
+    return _crop_record(crop_name)[3]
 
 def get_crop_info(crop_name):
     """Get complete crop information."""
-    crop_name = crop_name.lower()
+    duration, season, water, temp = _crop_record(crop_name)
     return {
         'crop': crop_name.capitalize(),
-        'cycle_duration_days': get_crop_cycle(crop_name),
-        'season': get_crop_season(crop_name),
-        'water_requirement_mm': get_water_requirement(crop_name),
-        'optimal_temp_range_c': get_optimal_temp_range(crop_name),
+        'cycle_duration_days': duration,
+        'season': season,
+        'water_requirement_mm': water,
+        'optimal_temp_range_c': temp,
     }
 
 # Example usage
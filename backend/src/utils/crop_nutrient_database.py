@@ -11,11 +11,31 @@ Data sourced from:
 Units: kg/ha (kilograms per hectare) for average yield
 """
 
-from typing import Dict, Optional, Tuple
+from bisect import bisect_right
+from functools import lru_cache
+from typing import Dict, NamedTuple, Optional
+
+import numpy as np
+
+from src.models.rindm import calculate_rainfall_loss
+
+
+class CropUptake(NamedTuple):
+    """Nutrient uptake record for one crop (kg/ha at average yield)."""
+    N_uptake_kg_ha: int
+    P_uptake_kg_ha: int
+    K_uptake_kg_ha: int
+    cycle_days: int
+    average_yield_tonnes_ha: float
+    source: str
+    
+    def to_dict(self) -> Dict:
+        """Plain dictionary form, for JSON responses."""
+        return dict(self._asdict())
 
 
 # Complete nutrient uptake data for all 22 crops
-CROP_NUTRIENT_UPTAKE = {
+_CROP_UPTAKE_RAW = {
     'rice': {
         'N_uptake_kg_ha': 120,
         'P_uptake_kg_ha': 40,
@@ -194,6 +214,17 @@ CROP_NUTRIENT_UPTAKE = {
     }
 }
 
+CROP_NUTRIENT_UPTAKE = {name: CropUptake(**data) for name, data in _CROP_UPTAKE_RAW.items()}
+
+
+# Column arrays over the crops in name order, for get_all_crops_summary
+_CROP_NAMES = np.array(sorted(CROP_NUTRIENT_UPTAKE))
+_N_UPTAKE = np.array([CROP_NUTRIENT_UPTAKE[name].N_uptake_kg_ha for name in _CROP_NAMES], dtype=np.int16)
+_P_UPTAKE = np.array([CROP_NUTRIENT_UPTAKE[name].P_uptake_kg_ha for name in _CROP_NAMES], dtype=np.int16)
+_K_UPTAKE = np.array([CROP_NUTRIENT_UPTAKE[name].K_uptake_kg_ha for name in _CROP_NAMES], dtype=np.int16)
+_CYCLE_DAYS = np.array([CROP_NUTRIENT_UPTAKE[name].cycle_days for name in _CROP_NAMES], dtype=np.int16)
+_YIELD = np.array([CROP_NUTRIENT_UPTAKE[name].average_yield_tonnes_ha for name in _CROP_NAMES], dtype=np.float64)
+
 
 # Minimum threshold levels below which soil testing is recommended (kg/ha)
 NUTRIENT_THRESHOLDS = {
@@ -220,11 +251,56 @@ NUTRIENT_THRESHOLDS = {
 }
 
 
+# Cut points per nutrient in ascending order (critical, low, adequate, high);
+# bisect_right(cuts, value) gives the status band index used below
+_THRESHOLDS = {
+    nutrient: tuple(NUTRIENT_THRESHOLDS[level][nutrient] for level in ('critical', 'low', 'adequate', 'high'))
+    for nutrient in ('N', 'P', 'K')
+}
+
+# Status bands from lowest to highest: (level, color, message template, action)
+_STATUS_BANDS = (
+    ('CRITICAL', 'red',
+     '⚠️ CRITICAL: {} is severely depleted. Immediate soil testing and fertilization required!',
+     'URGENT: Test soil and apply fertilizer immediately'),
+    ('LOW', 'orange',
+     '⚡ LOW: {} levels are low. Plan fertilization before next crop.',
+     'RECOMMENDED: Soil test and fertilization needed soon'),
+    ('MODERATE', 'yellow',
+     '✓ MODERATE: {} is adequate but monitor levels.',
+     'Monitor: Consider soil test if planning heavy-feeding crops'),
+    ('GOOD', 'lightgreen',
+     '✓ GOOD: {} levels are good for crop production.',
+     'No action needed'),
+    ('HIGH', 'green',
+     '✓✓ HIGH: {} levels are excellent.',
+     'No fertilization needed'),
+)
+
+# Bands at or below this index call for a soil test (CRITICAL, LOW)
+_SOIL_TEST_BAND = 1
+
+# Prebuilt status dicts per nutrient, indexed by band
+_STATUS_CACHE = {
+    nutrient: [
+        {
+            'level': level,
+            'status': level.lower(),
+            'color': color,
+            'message': message.format(nutrient),
+            'action': action
+        }
+        for level, color, message, action in _STATUS_BANDS
+    ]
+    for nutrient in ('N', 'P', 'K')
+}
+
+
 # Safety buffer to add before warning (to account for measurement uncertainty)
 SAFETY_BUFFER_PERCENTAGE = 10  # Add 10% buffer to threshold
 
 
-def get_crop_nutrient_uptake(crop_name: str) -> Optional[Dict]:
+def get_crop_nutrient_uptake(crop_name: str) -> Optional[CropUptake]:
     """
     Get nutrient uptake data for a specific crop.
     
@@ -232,12 +308,50 @@ def get_crop_nutrient_uptake(crop_name: str) -> Optional[Dict]:
         crop_name: Name of the crop (case-insensitive)
         
     Returns:
-        Dictionary with uptake data or None if crop not found
+        CropUptake record or None if crop not found
     """
-    crop_name_lower = crop_name.lower()
-    return CROP_NUTRIENT_UPTAKE.get(crop_name_lower)
+    return CROP_NUTRIENT_UPTAKE.get(crop_name.lower())
+
 
+class Vec3(NamedTuple):
+    """N, P, K values (kg/ha)."""
+    N: float
+    P: float
+    K: float
 
+
+class NutrientResult(NamedTuple):
+    """Remaining nutrients after a crop, with the depletion breakdown."""
+    remaining: Vec3
+    crop_uptake: Vec3
+    rainfall_loss: Vec3
+    total_depletion: Vec3
+    initial: Vec3
+    crop_name: str
+    cycle_days: int
+    average_yield: float
+    
+    def to_dict(self) -> Dict:
+        """Nested dictionary form, for JSON responses."""
+        return {
+            'remaining_nutrients': self.remaining._asdict(),
+            'depletion_breakdown': {
+                'crop_uptake': self.crop_uptake._asdict(),
+                'rainfall_loss': self.rainfall_loss._asdict(),
+                'total_depletion': self.total_depletion._asdict()
+            },
+            'initial_nutrients': self.initial._asdict(),
+            'crop_info': {
+                'name': self.crop_name,
+                'cycle_days': self.cycle_days,
+                'average_yield': self.average_yield
+            }
+        }
+
+
+# Results are immutable, so repeated scenarios (e.g. the UI re-running a
+# prediction) can share them; typed keeps 90 and 90.0 apart in the output
+@lru_cache(maxsize=256, typed=True)
 def calculate_remaining_nutrients(
     initial_N: float,
     initial_P: float,
@@ -246,7 +360,7 @@ def calculate_remaining_nutrients(
     rainfall_loss_N: float = 0,
     rainfall_loss_P: float = 0,
     rainfall_loss_K: float = 0
-) -> Dict:
+) -> NutrientResult:
     """
     Calculate remaining nutrients after crop uptake and rainfall loss.
     
@@ -258,7 +372,8 @@ def calculate_remaining_nutrients(
         rainfall_loss_N, rainfall_loss_P, rainfall_loss_K: Losses from RINDM (kg/ha)
         
     Returns:
-        Dictionary with remaining nutrients and breakdown
+        NutrientResult with remaining nutrients and breakdown
+        (use .to_dict() for the nested dictionary form)
     """
     crop_data = get_crop_nutrient_uptake(crop_name)
     
@@ -266,9 +381,9 @@ def calculate_remaining_nutrients(
         raise ValueError(f"Crop '{crop_name}' not found in database")
     
     # Get uptake values
-    crop_uptake_N = crop_data['N_uptake_kg_ha']
-    crop_uptake_P = crop_data['P_uptake_kg_ha']
-    crop_uptake_K = crop_data['K_uptake_kg_ha']
+    crop_uptake_N = crop_data.N_uptake_kg_ha
+    crop_uptake_P = crop_data.P_uptake_kg_ha
+    crop_uptake_K = crop_data.K_uptake_kg_ha
     
     # Calculate total depletion
     total_N_depletion = crop_uptake_N + rainfall_loss_N
@@ -280,40 +395,16 @@ def calculate_remaining_nutrients(
     remaining_P = max(0, initial_P - total_P_depletion)
     remaining_K = max(0, initial_K - total_K_depletion)
     
-    return {
-        'remaining_nutrients': {
-            'N': round(remaining_N, 2),
-            'P': round(remaining_P, 2),
-            'K': round(remaining_K, 2)
-        },
-        'depletion_breakdown': {
-            'crop_uptake': {
-                'N': crop_uptake_N,
-                'P': crop_uptake_P,
-                'K': crop_uptake_K
-            },
-            'rainfall_loss': {
-                'N': round(rainfall_loss_N, 2),
-                'P': round(rainfall_loss_P, 2),
-                'K': round(rainfall_loss_K, 2)
-            },
-            'total_depletion': {
-                'N': round(total_N_depletion, 2),
-                'P': round(total_P_depletion, 2),
-                'K': round(total_K_depletion, 2)
-            }
-        },
-        'initial_nutrients': {
-            'N': initial_N,
-            'P': initial_P,
-            'K': initial_K
-        },
-        'crop_info': {
-            'name': crop_name,
-            'cycle_days': crop_data['cycle_days'],
-            'average_yield': crop_data['average_yield_tonnes_ha']
-        }
-    }
+    return NutrientResult(
+        remaining=Vec3(round(remaining_N, 2), round(remaining_P, 2), round(remaining_K, 2)),
+        crop_uptake=Vec3(crop_uptake_N, crop_uptake_P, crop_uptake_K),
+        rainfall_loss=Vec3(round(rainfall_loss_N, 2), round(rainfall_loss_P, 2), round(rainfall_loss_K, 2)),
+        total_depletion=Vec3(round(total_N_depletion, 2), round(total_P_depletion, 2), round(total_K_depletion, 2)),
+        initial=Vec3(initial_N, initial_P, initial_K),
+        crop_name=crop_name,
+        cycle_days=crop_data.cycle_days,
+        average_yield=crop_data.average_yield_tonnes_ha
+    )
 
 
 def check_nutrient_status(N: float, P: float, K: float) -> Dict:
@@ -325,72 +416,30 @@ def check_nutrient_status(N: float, P: float, K: float) -> Dict:
         
     Returns:
         Dictionary with status and warnings for each nutrient
+        (the per-nutrient status dicts are shared; do not modify them)
     """
-    def get_status(nutrient_value: float, nutrient_name: str) -> Dict:
-        """Determine status level for a nutrient."""
-        
-        if nutrient_value < NUTRIENT_THRESHOLDS['critical'][nutrient_name]:
-            return {
-                'level': 'CRITICAL',
-                'status': 'critical',
-                'color': 'red',
-                'message': f'⚠️ CRITICAL: {nutrient_name} is severely depleted. Immediate soil testing and fertilization required!',
-                'action': 'URGENT: Test soil and apply fertilizer immediately'
-            }
-        elif nutrient_value < NUTRIENT_THRESHOLDS['low'][nutrient_name]:
-            return {
-                'level': 'LOW',
-                'status': 'low',
-                'color': 'orange',
-                'message': f'⚡ LOW: {nutrient_name} levels are low. Plan fertilization before next crop.',
-                'action': 'RECOMMENDED: Soil test and fertilization needed soon'
-            }
-        elif nutrient_value < NUTRIENT_THRESHOLDS['adequate'][nutrient_name]:
-            return {
-                'level': 'MODERATE',
-                'status': 'moderate',
-                'color': 'yellow',
-                'message': f'✓ MODERATE: {nutrient_name} is adequate but monitor levels.',
-                'action': 'Monitor: Consider soil test if planning heavy-feeding crops'
-            }
-        elif nutrient_value < NUTRIENT_THRESHOLDS['high'][nutrient_name]:
-            return {
-                'level': 'GOOD',
-                'status': 'good',
-                'color': 'lightgreen',
-                'message': f'✓ GOOD: {nutrient_name} levels are good for crop production.',
-                'action': 'No action needed'
-            }
-        else:
-            return {
-                'level': 'HIGH',
-                'status': 'high',
-                'color': 'green',
-                'message': f'✓✓ HIGH: {nutrient_name} levels are excellent.',
-                'action': 'No fertilization needed'
-            }
+    # Band index per nutrient: 0 = CRITICAL ... 4 = HIGH
+    N_band = bisect_right(_THRESHOLDS['N'], N)
+    P_band = bisect_right(_THRESHOLDS['P'], P)
+    K_band = bisect_right(_THRESHOLDS['K'], K)
     
-    N_status = get_status(N, 'N')
-    P_status = get_status(P, 'P')
-    K_status = get_status(K, 'K')
+    N_status = _STATUS_CACHE['N'][N_band]
+    P_status = _STATUS_CACHE['P'][P_band]
+    K_status = _STATUS_CACHE['K'][K_band]
     
-    # Determine overall status (worst case)
-    status_priority = {'CRITICAL': 4, 'LOW': 3, 'MODERATE': 2, 'GOOD': 1, 'HIGH': 0}
-    overall_status = max([N_status, P_status, K_status], 
-                         key=lambda x: status_priority[x['level']])
+    # Overall status is the worst band; level and color depend only on the band
+    worst_band = min(N_band, P_band, K_band)
+    overall_level, overall_color = _STATUS_BANDS[worst_band][:2]
     
-    # Check if any nutrient is critical
-    needs_soil_test = any(
-        status['level'] in ['CRITICAL', 'LOW'] 
-        for status in [N_status, P_status, K_status]
-    )
+    # Check if any nutrient is critical or low
+    needs_soil_test = worst_band <= _SOIL_TEST_BAND
     
     return {
         'N': N_status,
         'P': P_status,
         'K': K_status,
-        'overall_status': overall_status['level'],
-        'overall_color': overall_status['color'],
+        'overall_status': overall_level,
+        'overall_color': overall_color,
         'needs_soil_test': needs_soil_test,
         'soil_test_message': (
             '🔬 SOIL TEST RECOMMENDED: One or more nutrients are below optimal levels. '
@@ -426,8 +475,6 @@ def predict_future_nutrients(
     Returns:
         Predicted remaining nutrients and warnings
     """
-    from .rindm import calculate_rainfall_loss
-    
     # Get crop data
     crop_data = get_crop_nutrient_uptake(planned_crop)
     if not crop_data:
@@ -457,14 +504,10 @@ def predict_future_nutrients(
     )
     
     # Check status of predicted nutrients
-    predicted_N = result['remaining_nutrients']['N']
-    predicted_P = result['remaining_nutrients']['P']
-    predicted_K = result['remaining_nutrients']['K']
-    
-    status = check_nutrient_status(predicted_N, predicted_P, predicted_K)
+    status = check_nutrient_status(*result.remaining)
     
     return {
-        'prediction': result,
+        'prediction': result.to_dict(),
         'status': status,
         'warnings': {
             'will_need_fertilizer': status['needs_soil_test'],
@@ -477,18 +520,21 @@ def predict_future_nutrients(
 
 
 def get_all_crops_summary() -> list:
-    """Get summary of all crops with their nutrient requirements."""
-    summary = []
-    for crop_name, data in CROP_NUTRIENT_UPTAKE.items():
-        summary.append({
+    """Get summary of all crops with their nutrient requirements (sorted by crop)."""
+    return [
+        {
             'crop': crop_name.capitalize(),
-            'N': data['N_uptake_kg_ha'],
-            'P': data['P_uptake_kg_ha'],
-            'K': data['K_uptake_kg_ha'],
-            'cycle_days': data['cycle_days'],
-            'yield_tonnes_ha': data['average_yield_tonnes_ha']
-        })
-    return sorted(summary, key=lambda x: x['crop'])
+            'N': n,
+            'P': p,
+            'K': k,
+            'cycle_days': cycle_days,
+            'yield_tonnes_ha': yield_tonnes_ha
+        }
+        for crop_name, n, p, k, cycle_days, yield_tonnes_ha in zip(
+            _CROP_NAMES.tolist(), _N_UPTAKE.tolist(), _P_UPTAKE.tolist(),
+            _K_UPTAKE.tolist(), _CYCLE_DAYS.tolist(), _YIELD.tolist()
+        )
+    ]
 
 
 if __name__ == "__main__":
@@ -501,8 +547,8 @@ if __name__ == "__main__":
     print("\nTEST 1: Get Crop Nutrient Uptake")
     print("-" * 80)
     rice_data = get_crop_nutrient_uptake('rice')
-    print(f"Rice: N={rice_data['N_uptake_kg_ha']}, P={rice_data['P_uptake_kg_ha']}, "
-          f"K={rice_data['K_uptake_kg_ha']} kg/ha")
+    print(f"Rice: N={rice_data.N_uptake_kg_ha}, P={rice_data.P_uptake_kg_ha}, "
+          f"K={rice_data.K_uptake_kg_ha} kg/ha")
     
     # Test 2: Calculate remaining nutrients
     print("\nTEST 2: Calculate Remaining Nutrients After Rice Crop")
@@ -517,13 +563,13 @@ if __name__ == "__main__":
         rainfall_loss_K=8
     )
     print(f"Initial: N=90, P=42, K=43 kg/ha")
-    print(f"Crop Uptake: N={result['depletion_breakdown']['crop_uptake']['N']}, "
-          f"P={result['depletion_breakdown']['crop_uptake']['P']}, "
-          f"K={result['depletion_breakdown']['crop_uptake']['K']} kg/ha")
+    print(f"Crop Uptake: N={result.crop_uptake.N}, "
+          f"P={result.crop_uptake.P}, "
+          f"K={result.crop_uptake.K} kg/ha")
     print(f"Rainfall Loss: N=10, P=3, K=8 kg/ha")
-    print(f"Remaining: N={result['remaining_nutrients']['N']}, "
-          f"P={result['remaining_nutrients']['P']}, "
-          f"K={result['remaining_nutrients']['K']} kg/ha")
+    print(f"Remaining: N={result.remaining.N}, "
+          f"P={result.remaining.P}, "
+          f"K={result.remaining.K} kg/ha")
     
     # Test 3: Check nutrient status
     print("\nTEST 3: Check Nutrient Status")
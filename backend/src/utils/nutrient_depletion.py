@@ -0,0 +1,76 @@
+"""
+Nutrient Depletion Kernel
+
+Scores predicted N, P, K levels against critical and warning thresholds and
+estimates days until each nutrient turns critical. Shared by the single-cycle
+and batched early warnings in the predictive cycle advisor.
+
+Compiled with Numba when it is installed; otherwise runs as plain Python.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in so the kernel below runs as plain Python."""
+        def decorator(func):
+            return func
+        return decorator
+
+
+# Severity codes returned by compute_depletion (-1 means no warning)
+SEVERITY_LABELS = ('critical', 'urgent', 'warning', 'monitor')
+
+# Days-until-critical bounds: <=3 critical, <=7 urgent, otherwise warning
+_SEVERITY_DAY_BOUNDS = np.array([3, 7], dtype=np.int32)
+
+@njit(cache=True)
+def compute_depletion(cur, pred, crit, warn, has_history):
+    """
+    Depletion arithmetic kernel shared by single-cycle and batched warnings.
+    
+    Operates on parallel 1D arrays (one element per nutrient reading) so a
+    whole batch of cycles can be scored in one call.
+    
+    Args:
+        cur: Current nutrient levels (kg/ha)
+        pred: Predicted nutrient levels (NaN where no prediction exists)
+        crit: Critical thresholds for each element
+        warn: Warning thresholds for each element
+        has_history: True where enough history exists to estimate a rate
+    
+    Returns:
+        (days_until_critical int32, severity int8 index into SEVERITY_LABELS)
+    """
+    n = cur.shape[0]
+    days = np.zeros(n, dtype=np.int32)
+    severity = np.full(n, -1, dtype=np.int8)
+    below_critical = np.zeros(n, dtype=np.bool_)
+    
+    for i in range(n):
+        p = pred[i]
+        if np.isnan(p):
+            continue
+        
+        if p < crit[i]:
+            below_critical[i] = True
+            if has_history[i]:
+                daily_loss = (cur[i] - p) / 7
+                days[i] = int((crit[i] - p) / max(daily_loss, 0.1))
+            else:
+                days[i] = 7
+        
+        elif p < warn[i]:
+            severity[i] = 3
+    
+    # Bucket all depleted readings at once: searchsorted maps days to
+    # 0 (critical), 1 (urgent) or 2 (warning) without a branch per element
+    day_severity = np.searchsorted(_SEVERITY_DAY_BOUNDS, days).astype(np.int8)
+    severity = np.where(below_critical, day_severity, severity)
+    
+    return days, severity
@@ -5,10 +5,17 @@ Automatically fetches weather data for the specific crop cycle duration.
 Integrates with OpenWeatherMap API for real-time and historical data.
 """
 
-from datetime import datetime, timedelta
+from collections import OrderedDict
+from datetime import date, datetime, timedelta
 import json
+import random
+import re
 import requests
-from typing import Dict, List, Tuple, Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import threading
+import time
+from typing import Callable, Dict, List, Tuple, Optional
 import sys
 import os
 from pathlib import Path
@@ -26,6 +33,49 @@ except ImportError:
     from crop_database import get_crop_cycle
 
 
+# Response cache: longest time readings are reused (seconds; a shorter server
+# max-age wins, and TTLs are jittered +/-10% so entries don't all expire
+# together), coordinate precision (~1 km), and size
+CURRENT_WEATHER_TTL = 300
+FORECAST_TTL = 1800
+CACHE_COORD_DECIMALS = 2
+CACHE_MAX_ENTRIES = 1024
+
+# (connect, read) timeouts in seconds for API calls
+API_TIMEOUT = (2, 5)
+
+_MAX_AGE_RE = re.compile(r'max-age=(\d+)')
+
+
+def _parse_cache_control(header: str) -> Optional[int]:
+    """
+    Read how long the server says a response stays fresh.
+    
+    Args:
+        header: Cache-Control header value
+    
+    Returns:
+        max-age in seconds (0 for no-cache/no-store), or None if not given
+    """
+    if 'no-store' in header or 'no-cache' in header:
+        return 0
+    match = _MAX_AGE_RE.search(header)
+    return int(match.group(1)) if match else None
+
+
+def location_key(latitude: float, longitude: float) -> Tuple[float, float]:
+    """
+    Quantize coordinates to the weather cache cell (~1 km).
+    
+    Readings are cached per cell, so callers that group fields by this key
+    make exactly one lookup per cached reading.
+    """
+    return (
+        round(float(latitude), CACHE_COORD_DECIMALS),
+        round(float(longitude), CACHE_COORD_DECIMALS)
+    )
+
+
 class WeatherAPIFetcher:
     """
     Fetch real weather data from OpenWeatherMap API.
@@ -49,11 +99,70 @@ class WeatherAPIFetcher:
         self.api_key = api_key or os.getenv('OPENWEATHERMAP_API_KEY')
         self.base_url = "https://api.openweathermap.org/data/2.5"
         self.one_call_url = "https://api.openweathermap.org/data/3.0/onecall"
+        
+        # One keep-alive session so repeat calls skip the TCP/TLS handshake;
+        # the pool covers the weather monitor's worker threads
+        self.session = requests.Session()
+        retries = Retry(
+            total=2,
+            backoff_factor=0.2,
+            status_forcelist=[429, 500, 502, 503, 504],
+            raise_on_status=False
+        )
+        self.session.mount('https://', HTTPAdapter(pool_connections=10, pool_maxsize=50, max_retries=retries))
+        
+        # Successful responses keyed by (kind, lat, lon, ...) -> (expiry, data), oldest first
+        self._cache: "OrderedDict[Tuple, Tuple[float, object]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+    
+    def _cached_get(
+        self,
+        key: Tuple,
+        ttl: float,
+        fetch_fn: Callable[[], Tuple[Optional[object], Optional[int]]]
+    ) -> Optional[object]:
+        """
+        Return an unexpired cached response for key, or fetch and cache a new one.
+        
+        Args:
+            key: Cache key, including the rounded coordinates
+            ttl: Longest time to live in seconds (jittered by +/-10%)
+            fetch_fn: Makes the API call and returns (data, server max-age);
+                      None data is not cached, and a shorter max-age wins over ttl
+        
+        Returns:
+            Cached or freshly fetched data, or None if the fetch failed
+        """
+        with self._cache_lock:
+            cached = self._cache.get(key)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+        
+        data, max_age = fetch_fn()
+        if max_age is not None:
+            ttl = min(ttl, max_age)
+        
+        if data is not None and ttl > 0:
+            expiry = time.monotonic() + ttl * random.uniform(0.9, 1.1)
+            with self._cache_lock:
+                self._cache.pop(key, None)
+                self._cache[key] = (expiry, data)
+                while len(self._cache) > CACHE_MAX_ENTRIES:
+                    self._cache.popitem(last=False)
+        
+        return data
+    
+    def close(self):
+        """Close the pooled HTTP connections."""
+        self.session.close()
     
     def get_current_weather(self, latitude: float, longitude: float) -> Optional[Dict]:
         """
         Fetch current weather data for a location.
         
+        Readings are reused per ~1 km cell for up to CURRENT_WEATHER_TTL seconds
+        (less if the server's Cache-Control max-age is shorter).
+        
         Args:
             latitude: GPS latitude
             longitude: GPS longitude
@@ -65,6 +174,14 @@ class WeatherAPIFetcher:
             print("Warning: No OpenWeatherMap API key configured")
             return None
         
+        key = ('current', *location_key(latitude, longitude))
+        return self._cached_get(
+            key, CURRENT_WEATHER_TTL,
+            lambda: self._fetch_current_weather(latitude, longitude)
+        )
+    
+    def _fetch_current_weather(self, latitude: float, longitude: float) -> Tuple[Optional[Dict], Optional[int]]:
+        """Call the current weather endpoint (uncached); returns (weather, max-age)."""
         try:
             url = f"{self.base_url}/weather"
             params = {
@@ -74,10 +191,11 @@ class WeatherAPIFetcher:
                 'units': 'metric'
             }
             
-            response = requests.get(url, params=params, timeout=5)
+            response = self.session.get(url, params=params, timeout=API_TIMEOUT)
             
             if response.status_code == 200:
                 data = response.json()
+                max_age = _parse_cache_control(response.headers.get('Cache-Control', ''))
                 return {
                     'temperature': data['main']['temp'],
                     'humidity': data['main']['humidity'],
@@ -88,21 +206,21 @@ class WeatherAPIFetcher:
                     'description': data['weather'][0]['description'],
                     'location_name': data.get('name', 'Unknown'),
                     'country': data.get('sys', {}).get('country', '')
-                }
+                }, max_age
             else:
                 print(f"Weather API error - Status {response.status_code}: {response.text}")
-                return None
+                return None, None
                 
         except requests.exceptions.Timeout:
             print(f"Weather API timeout for location ({latitude}, {longitude})")
-            return None
+            return None, None
         except requests.exceptions.ConnectionError:
             print(f"Weather API connection error for location ({latitude}, {longitude})")
-            return None
+            return None, None
         except Exception as e:
             print(f"Error fetching current weather: {e}")
         
-        return None
+        return None, None
     
     def get_mock_weather(self, latitude: float, longitude: float) -> Dict:
         """
@@ -115,8 +233,6 @@ class WeatherAPIFetcher:
         Returns:
             Dictionary with simulated weather data
         """
-        import random
-        
         # Generate realistic mock data based on location
         base_temp = 25 + (latitude / 10)  # Vary by latitude
         
@@ -136,6 +252,9 @@ class WeatherAPIFetcher:
         """
         Fetch weather forecast for next N days.
         
+        Forecasts are reused per ~1 km cell for up to FORECAST_TTL seconds
+        (less if the server's Cache-Control max-age is shorter).
+        
         Args:
             latitude: GPS latitude
             longitude: GPS longitude
@@ -147,6 +266,14 @@ class WeatherAPIFetcher:
         if not self.api_key:
             return None
         
+        key = ('forecast', *location_key(latitude, longitude), days)
+        return self._cached_get(
+            key, FORECAST_TTL,
+            lambda: self._fetch_forecast_weather(latitude, longitude, days)
+        )
+    
+    def _fetch_forecast_weather(self, latitude: float, longitude: float, days: int) -> Tuple[Optional[List[Dict]], Optional[int]]:
+        """Call the 3-hourly forecast endpoint (uncached); returns (forecasts, max-age)."""
         try:
             url = f"{self.base_url}/forecast"
             params = {
@@ -157,7 +284,7 @@ class WeatherAPIFetcher:
                 'cnt': days * 8  # 8 forecasts per day (3-hour intervals)
             }
             
-            response = requests.get(url, params=params, timeout=5)
+            response = self.session.get(url, params=params, timeout=API_TIMEOUT)
             
             if response.status_code == 200:
                 data = response.json()
@@ -171,11 +298,11 @@ class WeatherAPIFetcher:
                         'timestamp': datetime.fromtimestamp(item['dt']).isoformat(),
                     })
                 
-                return forecasts
+                return forecasts, _parse_cache_control(response.headers.get('Cache-Control', ''))
         except Exception as e:
             print(f"Error fetching forecast: {e}")
         
-        return None
+        return None, None
     
     def average_forecast_weather(self, forecasts: List[Dict]) -> Optional[Dict]:
         """
@@ -233,8 +360,8 @@ class WeatherDataFetcher:
         """
         cycle_days = get_crop_cycle(crop_name)
         
-        # End date = today
-        end_date = datetime.now()
+        # End date = today (only the date is reported, so skip the clock)
+        end_date = date.today()
         
         # Start date = today - cycle days
         start_date = end_date - timedelta(days=cycle_days)
@@ -242,8 +369,8 @@ class WeatherDataFetcher:
         return {
             'crop': crop_name.capitalize(),
             'cycle_days': cycle_days,
-            'start_date': start_date.strftime('%Y-%m-%d'),
-            'end_date': end_date.strftime('%Y-%m-%d'),
+            'start_date': start_date.isoformat(),
+            'end_date': end_date.isoformat(),
             'period_description': f"Last {cycle_days} days (~{cycle_days/30:.1f} months)"
         }
     
@@ -278,7 +405,6 @@ class WeatherDataFetcher:
         Returns:
             Dictionary with mock weather averages
         """
-        import random
         return {
             'avg_temperature': round(random.uniform(20, 32), 2),
             'avg_humidity': round(random.uniform(50, 85), 2),
@@ -306,7 +432,8 @@ class WeatherDataFetcher:
         """
         period_info = self.get_weather_period(crop_name)
         
-        # Try to fetch real data if API is available
+        # Try to fetch real data if API is available; crops compared at one
+        # field share the fetcher's cached forecast for that location
         if self.api_fetcher and latitude and longitude and not self.use_mock:
             print(f"Fetching weather for {crop_name} from API...")
             
@@ -0,0 +1,44 @@
+"""Tests for the single CROP_DB table in crop_database."""
+
+from src.utils.crop_database import (
+    CROP_CYCLE_DURATION,
+    CROP_DB,
+    CROP_OPTIMAL_TEMP,
+    CROP_SEASON,
+    CROP_WATER_REQUIREMENT,
+    get_crop_cycle,
+    get_crop_info,
+    get_optimal_temp_range,
+)
+
+
+def test_attribute_views_match_crop_db():
+    for name, (duration, season, water, temp) in CROP_DB.items():
+        assert CROP_CYCLE_DURATION[name] == duration
+        assert CROP_SEASON[name] == season
+        assert CROP_WATER_REQUIREMENT[name] == water
+        assert CROP_OPTIMAL_TEMP[name] == temp
+
+
+def test_crop_info_reads_one_record():
+    for name, (duration, season, water, temp) in CROP_DB.items():
+        assert get_crop_info(name) == {
+            'crop': name.capitalize(),
+            'cycle_duration_days': duration,
+            'season': season,
+            'water_requirement_mm': water,
+            'optimal_temp_range_c': temp,
+        }
+
+
+def test_lookup_ignores_case():
+    assert get_crop_info('RICE') == get_crop_info('rice')
+    assert get_crop_cycle('Maize') == CROP_DB['maize'][0]
+
+
+def test_unknown_crop_uses_defaults():
+    info = get_crop_info('quinoa')
+    assert info['cycle_duration_days'] == 90
+    assert info['season'] == 'Year-round'
+    assert info['water_requirement_mm'] == 500
+    assert get_optimal_temp_range('quinoa') == (15, 30)
@@ -0,0 +1,56 @@
+"""Tests for the crop nutrient calculations in crop_nutrient_database."""
+
+import pytest
+
+from src.utils.crop_nutrient_database import (
+    CROP_NUTRIENT_UPTAKE,
+    calculate_remaining_nutrients,
+    get_all_crops_summary,
+)
+
+CROPS = sorted(CROP_NUTRIENT_UPTAKE)
+
+# (initial N, P, K), (rainfall loss N, P, K): plenty left, everything
+# clamped to 0 by max(0, ...), and a mix of the two
+SCENARIOS = [
+    ((400, 120, 600), (10.127, 3.3, 8.555)),
+    ((10, 5, 5), (0, 0, 0)),
+    ((150, 30, 160), (12.5, 0, 40.25)),
+]
+
+
+def test_all_22_crops_covered():
+    assert len(CROPS) == 22
+
+
+@pytest.mark.parametrize('initial, loss', SCENARIOS)
+def test_remaining_matches_formula(initial, loss):
+    for crop_name in CROPS:
+        crop = CROP_NUTRIENT_UPTAKE[crop_name]
+        uptake = (crop.N_uptake_kg_ha, crop.P_uptake_kg_ha, crop.K_uptake_kg_ha)
+        result = calculate_remaining_nutrients(*initial, crop_name, *loss)
+        
+        expected = [round(max(0, i - u - l), 2) for i, u, l in zip(initial, uptake, loss)]
+        assert list(result.remaining) == pytest.approx(expected, abs=1e-9)
+        assert list(result.crop_uptake) == list(uptake)
+
+
+def test_remaining_rejects_unknown_crop():
+    with pytest.raises(ValueError):
+        calculate_remaining_nutrients(90, 42, 43, 'wheat')
+
+
+def test_summary_columns_match_uptake_records():
+    summary = get_all_crops_summary()
+    
+    assert [row['crop'] for row in summary] == [name.capitalize() for name in CROPS]
+    for row, crop_name in zip(summary, CROPS):
+        crop = CROP_NUTRIENT_UPTAKE[crop_name]
+        assert row == {
+            'crop': crop_name.capitalize(),
+            'N': crop.N_uptake_kg_ha,
+            'P': crop.P_uptake_kg_ha,
+            'K': crop.K_uptake_kg_ha,
+            'cycle_days': crop.cycle_days,
+            'yield_tonnes_ha': crop.average_yield_tonnes_ha
+        }
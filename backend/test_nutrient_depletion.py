@@ -0,0 +1,79 @@
+"""Tests for the depletion kernel in nutrient_depletion."""
+
+import math
+
+import numpy as np
+
+from src.utils.nutrient_depletion import SEVERITY_LABELS, compute_depletion
+
+
+# Critical and warning thresholds (kg/ha) used by the predictive cycle advisor
+THRESHOLDS = {'N': (30, 60), 'P': (10, 20), 'K': (40, 80)}
+
+
+def _scalar_depletion(cur, pred, crit, warn, has_history):
+    """Per-reading depletion rule the kernel vectorizes: (days, severity label or None)."""
+    if math.isnan(pred):
+        return 0, None
+    if pred < crit:
+        if has_history:
+            daily_loss = (cur - pred) / 7
+            days = int((crit - pred) / max(daily_loss, 0.1))
+        else:
+            days = 7
+        if days <= 3:
+            return days, 'critical'
+        if days <= 7:
+            return days, 'urgent'
+        return days, 'warning'
+    if pred < warn:
+        return 0, 'monitor'
+    return 0, None
+
+
+def _run_kernel(cases):
+    cur, pred, crit, warn, history = zip(*cases)
+    return compute_depletion(
+        np.array(cur, dtype=np.float64), np.array(pred, dtype=np.float64),
+        np.array(crit, dtype=np.float64), np.array(warn, dtype=np.float64),
+        np.array(history, dtype=np.bool_)
+    )
+
+
+def test_kernel_matches_scalar_rule():
+    currents = [0.0, 12.0, 35.0, 70.0, 150.0]
+    predictions = [float('nan'), 0.0, 5.0, 9.9, 10.0, 29.5, 39.9, 55.0, 79.0, 200.0]
+    cases = [
+        (cur, pred, crit, warn, history)
+        for crit, warn in THRESHOLDS.values()
+        for cur in currents
+        for pred in predictions
+        for history in (True, False)
+    ]
+    
+    days, severity = _run_kernel(cases)
+    
+    for i, case in enumerate(cases):
+        expected_days, expected_label = _scalar_depletion(*case)
+        label = SEVERITY_LABELS[severity[i]] if severity[i] >= 0 else None
+        assert label == expected_label, case
+        if expected_label in ('critical', 'urgent', 'warning'):
+            assert days[i] == expected_days, case
+
+
+def test_day_bounds_are_inclusive():
+    # With history, days = int((crit - pred) / ((cur - pred) / 7)); pred 0 and
+    # crit 30 give days == 210 / cur, so cur picks the exact day count
+    cases = [(210.0 / d, 0.0, 30.0, 60.0, True) for d in (3, 4, 7, 8)]
+    days, severity = _run_kernel(cases)
+    assert days.tolist() == [3, 4, 7, 8]
+    assert [SEVERITY_LABELS[s] for s in severity] == ['critical', 'urgent', 'urgent', 'warning']
+
+
+def test_kernel_handles_empty_input():
+    empty = np.zeros(0, dtype=np.float64)
+    days, severity = compute_depletion(
+        empty, empty, empty, empty, np.zeros(0, dtype=np.bool_)
+    )
+    assert days.shape == (0,)
+    assert severity.shape == (0,)
@@ -0,0 +1,147 @@
+"""Tests for the batched early warnings in predictive_cycle_advisor."""
+
+import importlib
+import sys
+import types
+from contextlib import contextmanager
+
+import pytest
+from psycopg2 import OperationalError
+
+
+def _import_advisor():
+    """Import the advisor, standing in for the time-series manager if it is absent."""
+    try:
+        importlib.import_module('src.models.time_series_data_manager')
+    except ImportError:
+        stand_in = types.ModuleType('src.models.time_series_data_manager')
+        stand_in.TimeSeriesDataManager = lambda db: None
+        sys.modules['src.models.time_series_data_manager'] = stand_in
+    return importlib.import_module('src.services.predictive_cycle_advisor')
+
+
+advisor = _import_advisor()
+
+
+# cycle_id -> current (N, P, K) and latest predicted (N, P, K)
+STATES = {
+    1: (110.0, 40.0, 150.0),
+    2: (35.0, 12.0, 45.0),
+    3: (90.0, 9.0, 120.0),
+    4: (200.0, 60.0, 300.0),
+    5: (50.0, 15.0, 60.0),
+}
+PREDICTIONS = {
+    1: (25.0, 30.0, 100.0),
+    2: (20.0, 5.0, 30.0),
+    3: (50.0, 5.0, 70.0),
+    4: (190.0, 55.0, 290.0),
+    5: (None, 8.0, 35.0),
+}
+HISTORY_ROWS = {1: 12, 2: 3, 3: 30, 5: 9}
+
+
+class _FakeCursor:
+    """Answers the advisor's queries from the tables above, keyed by statement."""
+    
+    def __init__(self, inserts):
+        self.inserts = inserts
+        self._rows = []
+    
+    def execute(self, sql, params=None):
+        if sql == advisor._SQL_FETCH_CURRENT_NPK:
+            self._rows = [_state_row(params[0])] if params[0] in STATES else []
+        elif sql == advisor._SQL_FETCH_LATEST_PRED:
+            self._rows = [_prediction_row(params[0])] if params[0] in PREDICTIONS else []
+        elif sql == advisor._SQL_COUNT_CYCLE_ROWS:
+            self._rows = [{'num_rows': HISTORY_ROWS.get(params[0], 0)}]
+        elif sql == advisor._SQL_FETCH_CURRENT_NPK_BATCH:
+            self._rows = [_state_row(c) for c in params[0] if c in STATES]
+        elif sql == advisor._SQL_FETCH_LATEST_PRED_BATCH:
+            self._rows = [_prediction_row(c) for c in params[0] if c in PREDICTIONS]
+        elif sql == advisor._SQL_COUNT_CYCLE_ROWS_BATCH:
+            self._rows = [
+                {'cycle_id': c, 'num_rows': HISTORY_ROWS[c]}
+                for c in params[0] if c in HISTORY_ROWS
+            ]
+        elif sql == advisor._SQL_INSERT_WARNING:
+            self.inserts.append(params)
+        elif sql.split()[0] not in ('SAVEPOINT', 'RELEASE', 'ROLLBACK'):
+            raise AssertionError(f'unexpected statement: {sql}')
+    
+    def fetchone(self):
+        return self._rows[0] if self._rows else None
+    
+    def fetchall(self):
+        return list(self._rows)
+
+
+class _FakeDatabase:
+    """DatabaseManager stand-in that records warning inserts."""
+    
+    def __init__(self, reachable=True):
+        self.inserts = []
+        self.reachable = reachable
+        self.connections = 0
+    
+    def ping(self):
+        if not self.reachable:
+            raise OperationalError('server closed the connection unexpectedly')
+    
+    @contextmanager
+    def get_connection(self, cursor_factory=None):
+        self.connections += 1
+        yield None, _FakeCursor(self.inserts)
+
+
+def _state_row(cycle_id):
+    n, p, k = STATES[cycle_id]
+    return {'cycle_id': cycle_id, 'current_n_kg_ha': n, 'current_p_kg_ha': p, 'current_k_kg_ha': k}
+
+
+def _prediction_row(cycle_id):
+    n, p, k = PREDICTIONS[cycle_id]
+    return {'cycle_id': cycle_id, 'predicted_n_kg_ha': n, 'predicted_p_kg_ha': p, 'predicted_k_kg_ha': k}
+
+
+@pytest.fixture
+def make_advisor():
+    def make(reachable=True):
+        db = _FakeDatabase(reachable)
+        return advisor.PredictiveCycleAdvisor(db_manager=db), db
+    return make
+
+
+def test_batch_matches_single_cycle_warnings(make_advisor):
+    cycle_ids = [1, 2, 3, 4, 5, 99]
+    
+    single, single_db = make_advisor()
+    expected = {c: single.generate_early_warnings(c) for c in cycle_ids}
+    
+    batch, batch_db = make_advisor()
+    assert batch.generate_early_warnings_batch(cycle_ids) == expected
+    assert batch_db.inserts == single_db.inserts
+
+
+def test_batch_covers_every_severity(make_advisor):
+    batch, _ = make_advisor()
+    results = batch.generate_early_warnings_batch(list(STATES))
+    severities = {w['severity'] for warnings in results.values() for w in warnings}
+    assert severities == set(advisor.SEVERITY_LABELS)
+
+
+def test_batch_deduplicates_and_handles_empty_input(make_advisor):
+    batch, _ = make_advisor()
+    assert batch.generate_early_warnings_batch([]) == {}
+    assert list(batch.generate_early_warnings_batch([2, 2, 1])) == [2, 1]
+    assert batch.generate_early_warnings_batch([4]) == {4: []}
+
+
+def test_unreachable_database_fails_before_any_query(make_advisor):
+    offline, db = make_advisor(reachable=False)
+    assert offline.generate_early_warnings(1) == []
+    assert offline.generate_early_warnings_batch([1, 2]) == {1: [], 2: []}
+    result = offline.suggest_next_cycle_crop(farmer_id=1, field_id=1)
+    assert not result['success']
+    assert result['error'].startswith('Database unavailable')
+    assert db.connections == 0
@@ -23,10 +23,13 @@ if __name__ == "__main__":
         print(f"  Std: {X_train.std(axis=0)}")
         
         print(f"\nTarget Distribution (Training):")
-        unique, counts = np.unique(y_train, return_counts=True)
-        for crop_id, count in zip(unique, counts):
-            crop_name = preprocessor.label_encoder.inverse_transform([crop_id])[0]
-            print(f"  {crop_name}: {count} samples")
+        counts = np.bincount(y_train)
+        unique = np.flatnonzero(counts)
+        crop_names = preprocessor.label_encoder.inverse_transform(unique)
+        print("\n".join(
+            f"  {crop_name}: {count} samples"
+            for crop_name, count in zip(crop_names, counts[unique])
+        ))
         
         print(f"\nEncoders saved:")
         print(f"  Scaler: {preprocessor.scaler_save_path}")
@@ -0,0 +1,74 @@
+"""Tests for the batched RINDM loss against the per-event calculation."""
+
+import numpy as np
+import pytest
+
+from src.models.rindm import SOIL_TYPES, RainfallNutrientDepletionModel
+
+
+RAINFALL = [0.0, 5.0, 25.0, 60.0, 120.0, 300.0]
+DURATION = [0.0, 0.5, 2.0, 6.0, 24.0]
+NPK = (120.0, 35.5, 210.0)
+
+
+def _events():
+    """Every soil/rainfall/duration combination as one event each."""
+    return [
+        (soil, rain, hours)
+        for soil in SOIL_TYPES
+        for rain in RAINFALL
+        for hours in DURATION
+    ]
+
+
+def _assert_batch_matches_scalar(model, events, slopes):
+    soils = [soil for soil, _, _ in events]
+    rainfall = [rain for _, rain, _ in events]
+    duration = [hours for _, _, hours in events]
+    n = len(events)
+    
+    batch = model.calculate_nutrient_loss_batch(
+        rainfall, duration,
+        [NPK[0]] * n, [NPK[1]] * n, [NPK[2]] * n,
+        soils,
+        slope_degrees=slopes
+    )
+    
+    for i, (soil, rain, hours) in enumerate(events):
+        slope = slopes[i] if np.ndim(slopes) else slopes
+        scalar = model.calculate_nutrient_loss(
+            rain, hours, *NPK, soil_type=soil, slope_degrees=slope
+        )
+        for key in ('N_loss', 'P_loss', 'K_loss', 'N_remaining', 'P_remaining', 'K_remaining'):
+            # np.round and round() can split a .xx5 tie differently, so allow one cent
+            assert batch[key][i] == pytest.approx(scalar[key], abs=0.01 + 1e-9), (key, soil, rain, hours, slope)
+
+
+def test_batch_matches_scalar_with_shared_slope():
+    model = RainfallNutrientDepletionModel()
+    _assert_batch_matches_scalar(model, _events(), model.DEFAULT_SLOPE)
+
+
+def test_batch_matches_scalar_with_per_event_slope():
+    model = RainfallNutrientDepletionModel()
+    events = _events()
+    slopes = [float(i % 25) for i in range(len(events))]
+    _assert_batch_matches_scalar(model, events, slopes)
+
+
+def test_batch_never_loses_more_than_available():
+    model = RainfallNutrientDepletionModel()
+    batch = model.calculate_nutrient_loss_batch(
+        [1000.0], [1.0], [10.0], [5.0], [20.0], ['sandy'], slope_degrees=30.0
+    )
+    assert batch['N_remaining'][0] >= 0
+    assert batch['P_remaining'][0] >= 0
+    assert batch['K_remaining'][0] >= 0
+
+
+def test_batch_rejects_invalid_input():
+    model = RainfallNutrientDepletionModel()
+    with pytest.raises(ValueError):
+        model.calculate_nutrient_loss_batch([-1.0], [1.0], [10.0], [5.0], [20.0], ['clay'])
+    with pytest.raises(ValueError):
+        model.calculate_nutrient_loss_batch([10.0], [1.0], [10.0], [5.0], [20.0], ['peat'])
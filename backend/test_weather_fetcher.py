@@ -0,0 +1,114 @@
+"""Tests for the response cache in WeatherAPIFetcher."""
+
+import pytest
+
+from src.utils import weather_fetcher
+from src.utils.weather_fetcher import WeatherAPIFetcher, location_key
+
+
+class _Clock:
+    """Stand-in for time.monotonic that only moves when told to."""
+    
+    def __init__(self):
+        self.now = 1000.0
+    
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(weather_fetcher.time, 'monotonic', clock)
+    # No jitter, so expiry lands exactly on the TTL
+    monkeypatch.setattr(weather_fetcher.random, 'uniform', lambda a, b: 1.0)
+    return clock
+
+
+@pytest.fixture
+def fetcher():
+    fetcher = WeatherAPIFetcher(api_key='test-key')
+    yield fetcher
+    fetcher.close()
+
+
+def _counting_fetch(fetcher, max_age=None):
+    """Replace the current-weather API call with one that counts its calls."""
+    calls = []
+    
+    def fake(latitude, longitude):
+        calls.append((latitude, longitude))
+        return {'temperature': 25.0}, max_age
+    
+    fetcher._fetch_current_weather = fake
+    return calls
+
+
+def test_hit_within_ttl(clock, fetcher):
+    calls = _counting_fetch(fetcher)
+    first = fetcher.get_current_weather(11.0, 77.0)
+    clock.now += weather_fetcher.CURRENT_WEATHER_TTL - 1
+    assert fetcher.get_current_weather(11.0, 77.0) is first
+    assert len(calls) == 1
+
+
+def test_refetch_after_expiry(clock, fetcher):
+    calls = _counting_fetch(fetcher)
+    fetcher.get_current_weather(11.0, 77.0)
+    clock.now += weather_fetcher.CURRENT_WEATHER_TTL + 1
+    fetcher.get_current_weather(11.0, 77.0)
+    assert len(calls) == 2
+
+
+def test_server_max_age_caps_ttl(clock, fetcher):
+    calls = _counting_fetch(fetcher, max_age=60)
+    fetcher.get_current_weather(11.0, 77.0)
+    clock.now += 59
+    fetcher.get_current_weather(11.0, 77.0)
+    assert len(calls) == 1
+    clock.now += 2
+    fetcher.get_current_weather(11.0, 77.0)
+    assert len(calls) == 2
+
+
+def test_zero_max_age_is_not_cached(clock, fetcher):
+    calls = _counting_fetch(fetcher, max_age=0)
+    fetcher.get_current_weather(11.0, 77.0)
+    fetcher.get_current_weather(11.0, 77.0)
+    assert len(calls) == 2
+
+
+def test_failed_fetch_is_not_cached(clock, fetcher):
+    calls = []
+    
+    def failing(latitude, longitude):
+        calls.append((latitude, longitude))
+        return None, None
+    
+    fetcher._fetch_current_weather = failing
+    assert fetcher.get_current_weather(11.0, 77.0) is None
+    assert fetcher.get_current_weather(11.0, 77.0) is None
+    assert len(calls) == 2
+
+
+def test_nearby_coordinates_share_an_entry(clock, fetcher):
+    assert location_key(11.0012, 77.0049) == location_key(11.0, 77.0)
+    calls = _counting_fetch(fetcher)
+    fetcher.get_current_weather(11.0, 77.0)
+    fetcher.get_current_weather(11.0012, 77.0049)
+    assert len(calls) == 1
+    fetcher.get_current_weather(11.02, 77.0)
+    assert len(calls) == 2
+
+
+def test_oldest_entry_evicted_past_max_entries(clock, fetcher, monkeypatch):
+    monkeypatch.setattr(weather_fetcher, 'CACHE_MAX_ENTRIES', 3)
+    calls = _counting_fetch(fetcher)
+    for lat in (1.0, 2.0, 3.0, 4.0):
+        fetcher.get_current_weather(lat, 77.0)
+    assert len(fetcher._cache) == 3
+    
+    fetcher.get_current_weather(4.0, 77.0)
+    assert len(calls) == 4
+    fetcher.get_current_weather(1.0, 77.0)
+    assert len(calls) == 5
@@ -17,6 +17,7 @@ Charts generated:
 """
 
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Add paths for imports
@@ -32,15 +33,23 @@ from utils.plot_helper import PlotHelper
 from src.data.preprocess import DataPreprocessor
 
 
+MODEL_FILES = {
+    'Random Forest': 'random_forest.pkl',
+    'XGBoost': 'xgboost.pkl',
+    'CatBoost': 'catboost.pkl',
+    'SVM': 'svm.pkl',
+    'Ensemble': 'ensemble.pkl',
+}
+
+
 def load_models(model_dir):
-    """Load all trained models."""
-    models = {
-        'Random Forest': joblib.load(model_dir / 'random_forest.pkl'),
-        'XGBoost': joblib.load(model_dir / 'xgboost.pkl'),
-        'CatBoost': joblib.load(model_dir / 'catboost.pkl'),
-        'SVM': joblib.load(model_dir / 'svm.pkl'),
-        'Ensemble': joblib.load(model_dir / 'ensemble.pkl'),
-    }
+    """Load all trained models, in parallel so the file reads overlap."""
+    with ThreadPoolExecutor(max_workers=len(MODEL_FILES)) as pool:
+        futures = {
+            name: pool.submit(joblib.load, model_dir / filename)
+            for name, filename in MODEL_FILES.items()
+        }
+        models = {name: future.result() for name, future in futures.items()}
     return models
 
 
@@ -94,18 +103,15 @@ def main():
     predictions = {}
     probabilities = {}
     
+    # One model at a time: the tree models already predict on all cores, and
+    # the cross-validation below runs its folds serially for the same reason
     for name, model in models.items():
         print(f"    - {name}...")
         
-        y_pred = model.predict(X_test)
-        predictions[name] = y_pred
+        y_pred, y_pred_proba = MetricsCalculator.predict_with_proba(model, X_test)
         
-        if hasattr(model, 'predict_proba'):
-            y_pred_proba = model.predict_proba(X_test)
-            probabilities[name] = y_pred_proba
-        else:
-            y_pred_proba = None
-            probabilities[name] = None
+        predictions[name] = y_pred
+        probabilities[name] = y_pred_proba
         
         metrics = metrics_calc.compute_all_metrics(y_pred, y_pred_proba)
         all_metrics[name] = metrics
@@ -167,9 +173,7 @@ def main():
     
     for name, proba in probabilities.items():
         if proba is not None:
-            roc_data = metrics_calc.compute_roc_curves(proba)
-            roc_data_all[name] = roc_data
-            auc_scores[name] = metrics_calc.compute_mean_auc(proba)
+            roc_data_all[name], auc_scores[name] = metrics_calc.compute_roc_and_auc(proba)
     
     plotter.roc_curves_overlay(
         roc_data_all,
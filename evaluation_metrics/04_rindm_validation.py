@@ -149,18 +149,18 @@ def sensitivity_analysis_rainfall(model, plotter):
     print("=" * 60)
     
     rainfall_values = list(range(10, 310, 10))  # 10mm to 300mm
-    n_loss, p_loss, k_loss = [], [], []
-    
-    for rain in rainfall_values:
-        result = model.calculate_nutrient_loss(
-            rainfall_mm=rain,
-            duration_hours=4,  # Fixed duration
-            N_current=90, P_current=42, K_current=43,
-            soil_type='loamy'
-        )
-        n_loss.append(result['N_loss'])
-        p_loss.append(result['P_loss'])
-        k_loss.append(result['K_loss'])
+    n = len(rainfall_values)
+    
+    # One batched call over the whole sweep
+    result = model.calculate_nutrient_loss_batch(
+        rainfall_mm=rainfall_values,
+        duration_hours=[4] * n,  # Fixed duration
+        N_current=[90] * n, P_current=[42] * n, K_current=[43] * n,
+        soil_type=['loamy'] * n
+    )
+    n_loss = result['N_loss'].tolist()
+    p_loss = result['P_loss'].tolist()
+    k_loss = result['K_loss'].tolist()
     
     # Chart 15
     plotter.sensitivity_line_plot(
@@ -193,18 +193,17 @@ def sensitivity_analysis_intensity(model, plotter):
     durations = [10, 8, 6, 5, 4, 3, 2, 1.5, 1]  # Hours (longer = lower intensity)
     intensities = [rainfall_mm / d for d in durations]  # mm/hr
     
-    n_loss, p_loss, k_loss = [], [], []
+    n = len(durations)
     
-    for duration in durations:
-        result = model.calculate_nutrient_loss(
-            rainfall_mm=rainfall_mm,
-            duration_hours=duration,
-            N_current=90, P_current=42, K_current=43,
-            soil_type='loamy'
-        )
-        n_loss.append(result['N_loss'])
-        p_loss.append(result['P_loss'])
-        k_loss.append(result['K_loss'])
+    result = model.calculate_nutrient_loss_batch(
+        rainfall_mm=[rainfall_mm] * n,
+        duration_hours=durations,
+        N_current=[90] * n, P_current=[42] * n, K_current=[43] * n,
+        soil_type=['loamy'] * n
+    )
+    n_loss = result['N_loss'].tolist()
+    p_loss = result['P_loss'].tolist()
+    k_loss = result['K_loss'].tolist()
     
     # Chart 16
     plotter.sensitivity_line_plot(
@@ -232,19 +231,18 @@ def sensitivity_analysis_slope(model, plotter):
     print("=" * 60)
     
     slopes = list(range(0, 31, 2))  # 0° to 30°
-    n_loss, p_loss, k_loss = [], [], []
-    
-    for slope in slopes:
-        result = model.calculate_nutrient_loss(
-            rainfall_mm=100,
-            duration_hours=2,
-            N_current=90, P_current=42, K_current=43,
-            soil_type='loamy',
-            slope_degrees=slope
-        )
-        n_loss.append(result['N_loss'])
-        p_loss.append(result['P_loss'])
-        k_loss.append(result['K_loss'])
+    n = len(slopes)
+    
+    result = model.calculate_nutrient_loss_batch(
+        rainfall_mm=[100] * n,
+        duration_hours=[2] * n,
+        N_current=[90] * n, P_current=[42] * n, K_current=[43] * n,
+        soil_type=['loamy'] * n,
+        slope_degrees=slopes
+    )
+    n_loss = result['N_loss'].tolist()
+    p_loss = result['P_loss'].tolist()
+    k_loss = result['K_loss'].tolist()
     
     # Chart 17
     plotter.sensitivity_line_plot(
@@ -119,9 +119,48 @@ class MetricsCalculator:
         Returns:
             Mean AUC score
         """
+        return self.compute_roc_and_auc(y_pred_proba)[1]
+    
+    def compute_roc_and_auc(self, y_pred_proba):
+        """
+        Compute ROC curves and mean AUC from one pass over the classes.
+        
+        Args:
+            y_pred_proba: Predicted probabilities
+        
+        Returns:
+            Tuple of (ROC data as from compute_roc_curves, mean AUC)
+        """
         roc_data = self.compute_roc_curves(y_pred_proba)
         aucs = [data['auc'] for data in roc_data.values()]
-        return np.mean(aucs)
+        return roc_data, np.mean(aucs)
+    
+    @staticmethod
+    def predict_with_proba(model, X):
+        """
+        Predict labels and class probabilities with one inference pass.
+        
+        Tree models and the soft-voting ensemble predict the most probable
+        class, so labels are taken from the probabilities. SVC predicts from
+        its decision function, which can disagree with Platt-scaled
+        probabilities, so it still calls predict.
+        
+        Args:
+            model: Fitted classifier
+            X: Features
+        
+        Returns:
+            (y_pred, y_pred_proba); y_pred_proba is None if the model has no predict_proba
+        """
+        if not hasattr(model, 'predict_proba'):
+            return model.predict(X), None
+        
+        y_pred_proba = model.predict_proba(X)
+        if hasattr(model, 'decision_function'):
+            y_pred = model.predict(X)
+        else:
+            y_pred = model.classes_[np.argmax(y_pred_proba, axis=1)]
+        return y_pred, y_pred_proba
     
     @staticmethod
     def cross_validation_scores(model, X, y, cv=5, scoring='accuracy'):
@@ -277,14 +316,17 @@ class MetricsCalculator:
         """
         max_proba = np.max(y_pred_proba, axis=1)
         correct = y_pred == y_true
+        # Split once; the stats below reuse these arrays
+        correct_conf = max_proba[correct]
+        incorrect_conf = max_proba[~correct]
         
         return {
-            'correct_mean_confidence': float(np.mean(max_proba[correct])) if np.sum(correct) > 0 else 0,
-            'correct_std_confidence': float(np.std(max_proba[correct])) if np.sum(correct) > 0 else 0,
-            'incorrect_mean_confidence': float(np.mean(max_proba[~correct])) if np.sum(~correct) > 0 else 0,
-            'incorrect_std_confidence': float(np.std(max_proba[~correct])) if np.sum(~correct) > 0 else 0,
-            'correct_confidences': max_proba[correct],
-            'incorrect_confidences': max_proba[~correct]
+            'correct_mean_confidence': float(np.mean(correct_conf)) if correct_conf.size else 0,
+            'correct_std_confidence': float(np.std(correct_conf)) if correct_conf.size else 0,
+            'incorrect_mean_confidence': float(np.mean(incorrect_conf)) if incorrect_conf.size else 0,
+            'incorrect_std_confidence': float(np.std(incorrect_conf)) if incorrect_conf.size else 0,
+            'correct_confidences': correct_conf,
+            'incorrect_confidences': incorrect_conf
         }
     
     @staticmethod